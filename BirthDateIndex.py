@@ -0,0 +1,248 @@
+# This class contains the birth date index used by FamilyTree
+# It keeps everyone sorted by date of birth, stored as ordinal day ints,
+# so people born in a date range can be found with a binary search
+# People added out of order are sorted on the next query, so bulk loading stays linear
+# It also builds the age histograms, overall or split by generation using the generations from GenerationIndex
+# The histograms use AgeColumns, sorted columns of ordinals built once after people are added, marked deceased
+# or change generation, so each histogram is counted with a few binary searches per age bracket instead of a loop over everyone
+
+from array import array
+import bisect
+import calendar
+import datetime
+from typing import Dict, List, Optional, Tuple
+from Person import Person
+
+class BirthDateIndex:
+    """BirthDateIndex class stores people sorted by date of birth for range and age queries"""
+    def __init__(self):
+        """
+            Create an empty birth date index
+        """
+        self.births: array = array("l")
+        self.people: List[Person] = []
+        self.up_to_date: bool = True
+        # The age columns of everyone and of each generation, None when they are out of date
+        self.columns: Optional["AgeColumns"] = None
+        self.generation_columns: Optional[Dict[int, "AgeColumns"]] = None
+
+    def add(self, person: Person) -> None:
+        """
+            Add a person to the index
+            People are normally added in order of birth, so they are appended and only sorted when needed
+            :param person: the person to add
+        """
+        birth: int = person.date_of_birth.toordinal()
+        if len(self.births) > 0 and birth < self.births[-1]:
+            self.up_to_date = False
+        self.births.append(birth)
+        self.people.append(person)
+        self.update()
+
+    def sort(self) -> None:
+        """
+            Sort the index by date of birth, people born on the same day stay in the order they were added
+        """
+        order: List[int] = sorted(range(len(self.births)), key=self.births.__getitem__)
+        self.births = array("l", [self.births[i] for i in order])
+        self.people = [self.people[i] for i in order]
+        self.up_to_date = True
+
+    def born_between(self, start: datetime.date, end: datetime.date) -> List[Person]:
+        """
+            Get the people born between two dates
+            :param start: the first date, inclusive
+            :param end: the last date, inclusive
+            :return: the people born in the range, ordered by date of birth
+        """
+        if not self.up_to_date:
+            self.sort()
+        first: int = bisect.bisect_left(self.births, start.toordinal())
+        last: int = bisect.bisect_right(self.births, end.toordinal())
+        return self.people[first:last]
+
+    @staticmethod
+    def get_age(date_of_birth: datetime.date, date: datetime.date) -> int:
+        """
+            Get someone's age in whole years on a date
+            :param date_of_birth: their date of birth
+            :param date: the date to find their age on
+            :return: their age in years
+        """
+        return date.year - date_of_birth.year - ((date.month, date.day) < (date_of_birth.month, date_of_birth.day))
+
+    def update(self) -> None:
+        """
+            Mark the age histograms as out of date, e.g. after someone has been marked deceased
+        """
+        self.columns = None
+        self.generation_columns = None
+
+    def update_generations(self) -> None:
+        """
+            Mark the age histograms by generation as out of date, e.g. after someone's parents have changed
+        """
+        self.generation_columns = None
+
+    def get_columns(self) -> "AgeColumns":
+        """
+            Get the age columns of everyone, building them if they are out of date
+            :return: the age columns
+        """
+        if self.columns is None:
+            self.columns = AgeColumns(self.people)
+        return self.columns
+
+    def get_generation_columns(self, generations: Dict[Person, Tuple[int, int]]) -> Dict[int, "AgeColumns"]:
+        """
+            Get the age columns of each max generation, building them if they are out of date
+            :param generations: the (min, max) generation of each person
+            :return: each max generation mapped to the age columns of the people in it, ordered by generation
+        """
+        if self.generation_columns is None:
+            people_by_generation: Dict[int, List[Person]] = {}
+            for person in self.people:
+                people_by_generation.setdefault(generations[person][1], []).append(person)
+            self.generation_columns = {generation: AgeColumns(people_by_generation[generation]) for generation in sorted(people_by_generation)}
+        return self.generation_columns
+
+    def get_age_distribution(self, date: Optional[datetime.date] = None, bucket_size: int = 10) -> Dict[int, int]:
+        """
+            Count the people alive on a date by age bracket
+            :param date: the date to find ages on, defaults to today
+            :param bucket_size: the number of years in each bracket, 10 groups by decade
+            :return: the first age of each bracket mapped to the number of people in it, ordered by age
+        """
+        return self.get_columns().get_age_distribution(date or datetime.date.today(), bucket_size)
+
+    def get_age_at_death_distribution(self, bucket_size: int = 10) -> Dict[int, int]:
+        """
+            Count deceased people by the age bracket they died in
+            :param bucket_size: the number of years in each bracket, 10 groups by decade
+            :return: the first age of each bracket mapped to the number of people who died in it, ordered by age
+        """
+        return self.get_columns().get_age_at_death_distribution(bucket_size)
+
+    def get_age_distribution_by_generation(self, generations: Dict[Person, Tuple[int, int]], date: Optional[datetime.date] = None, bucket_size: int = 10) -> Dict[int, Dict[int, int]]:
+        """
+            Count the people alive on a date by generation and age bracket
+            :param generations: the (min, max) generation of each person
+            :param date: the date to find ages on, defaults to today
+            :param bucket_size: the number of years in each bracket, 10 groups by decade
+            :return: each max generation with anyone alive mapped to the number of people in each bracket, as in get_age_distribution
+        """
+        distributions: Dict[int, Dict[int, int]] = {}
+        for generation, columns in self.get_generation_columns(generations).items():
+            distribution: Dict[int, int] = columns.get_age_distribution(date or datetime.date.today(), bucket_size)
+            if len(distribution) > 0:
+                distributions[generation] = distribution
+        return distributions
+
+    def get_age_at_death_distribution_by_generation(self, generations: Dict[Person, Tuple[int, int]], bucket_size: int = 10) -> Dict[int, Dict[int, int]]:
+        """
+            Count deceased people by generation and the age bracket they died in
+            :param generations: the (min, max) generation of each person
+            :param bucket_size: the number of years in each bracket, 10 groups by decade
+            :return: each max generation with anyone deceased mapped to the number of people who died in each bracket
+        """
+        distributions: Dict[int, Dict[int, int]] = {}
+        for generation, columns in self.get_generation_columns(generations).items():
+            distribution: Dict[int, int] = columns.get_age_at_death_distribution(bucket_size)
+            if len(distribution) > 0:
+                distributions[generation] = distribution
+        return distributions
+
+class AgeColumns:
+    """AgeColumns class stores sorted ordinal columns of a group of people for counting them by age bracket"""
+    def __init__(self, people: List[Person]):
+        """
+            Build the columns, this takes O(N log N) time and the deceased births take O(N log N) memory
+            :param people: the people in the group
+        """
+        self.births: array = array("l", sorted(person.date_of_birth.toordinal() for person in people))
+        deceased: List[Person] = sorted((person for person in people if person.date_of_death is not None), key=lambda person: person.date_of_death)
+        self.deaths: array = array("l", [person.date_of_death.toordinal() for person in deceased])
+        self.ages_at_death: array = array("l", sorted(BirthDateIndex.get_age(person.date_of_birth, person.date_of_death) for person in deceased))
+
+        # A Fenwick tree over the deceased in order of death, node i holds the sorted births of the deceased in (i - lowbit(i), i]
+        # so the number of the first k to die who were born by a date takes O(log² N) time
+        self.deceased_births: List[array] = [array("l")]
+        for i in range(1, len(deceased) + 1):
+            self.deceased_births.append(array("l", sorted(person.date_of_birth.toordinal() for person in deceased[i - (i & -i):i])))
+
+    @staticmethod
+    def get_latest_birth(date: datetime.date, age: int) -> int:
+        """
+            Get the latest date of birth of someone who is at least an age on a date
+            :param date: the date
+            :param age: the age in years
+            :return: the ordinal of the date of birth, 0 if no one can be that age
+        """
+        year: int = date.year - age
+        if year < datetime.MINYEAR:
+            return 0
+        # Someone born on the 29th of February has their birthday on the 1st of March in other years
+        if date.month == 2 and date.day == 29 and not calendar.isleap(year):
+            return datetime.date(year, 2, 28).toordinal()
+        return datetime.date(year, date.month, date.day).toordinal()
+
+    def count_deceased_born_by(self, died_before: int, latest_birth: int) -> int:
+        """
+            Count the people who died before a day and were born on or before another
+            :param died_before: the ordinal day they died before
+            :param latest_birth: the ordinal of the latest date of birth
+            :return: the number of people
+        """
+        count: int = 0
+        i: int = bisect.bisect_left(self.deaths, died_before)
+        while i > 0:
+            count += bisect.bisect_right(self.deceased_births[i], latest_birth)
+            i -= i & -i
+        return count
+
+    def count_alive_at_least(self, date: datetime.date, age: int) -> int:
+        """
+            Count the people alive on a date who are at least an age
+            :param date: the date, people who died on it count as alive
+            :param age: the age in years
+            :return: the number of people
+        """
+        latest_birth: int = AgeColumns.get_latest_birth(date, age)
+        return bisect.bisect_right(self.births, latest_birth) - self.count_deceased_born_by(date.toordinal(), latest_birth)
+
+    def get_age_distribution(self, date: datetime.date, bucket_size: int) -> Dict[int, int]:
+        """
+            Count the people alive on a date by age bracket, with two counts per bracket
+            :param date: the date to find ages on
+            :param bucket_size: the number of years in each bracket
+            :return: the first age of each bracket with anyone in it mapped to the number of people in it, ordered by age
+        """
+        distribution: Dict[int, int] = {}
+        if len(self.births) == 0 or self.births[0] > date.toordinal():
+            return distribution
+
+        # No one can be older than whoever was born first
+        oldest: int = BirthDateIndex.get_age(datetime.date.fromordinal(self.births[0]), date)
+        at_least: int = self.count_alive_at_least(date, 0)
+        for bracket in range(0, oldest + 1, bucket_size):
+            older: int = self.count_alive_at_least(date, bracket + bucket_size)
+            if at_least > older:
+                distribution[bracket] = at_least - older
+            at_least = older
+        return distribution
+
+    def get_age_at_death_distribution(self, bucket_size: int) -> Dict[int, int]:
+        """
+            Count deceased people by the age bracket they died in, with two binary searches per bracket
+            :param bucket_size: the number of years in each bracket
+            :return: the first age of each bracket with anyone in it mapped to the number of people who died in it, ordered by age
+        """
+        distribution: Dict[int, int] = {}
+        if len(self.ages_at_death) == 0:
+            return distribution
+
+        for bracket in range(0, self.ages_at_death[-1] + 1, bucket_size):
+            count: int = bisect.bisect_left(self.ages_at_death, bracket + bucket_size) - bisect.bisect_left(self.ages_at_death, bracket)
+            if count > 0:
+                distribution[bracket] = count
+        return distribution
@@ -0,0 +1,76 @@
+# This class loads the branches of a family tree saved with save_branches_to_csv one at a time
+# Only the small index of names is read up front, a branch is read from its own file the first time it is needed
+# The most recently used branches are kept in memory, so looking people up in a large tree does not need the whole tree
+
+import csv
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+from FamilyTree import FamilyTree
+from FamilyTreeCSV import BRANCH_FILE_NAME, BRANCH_INDEX_COLUMNS, BRANCH_INDEX_FILE_NAME, load_family_tree_from_csv
+from Person import Person
+
+class BranchStore:
+    """BranchStore class loads the branches of a saved family tree when they are needed"""
+    def __init__(self, directory: str, max_loaded_branches: int = 8):
+        """
+            Read the branch index of a family tree saved with save_branches_to_csv
+            :param directory: the directory the branches were saved in
+            :param max_loaded_branches: the number of branches to keep in memory
+            :raises ValueError: if the index header is wrong
+        """
+        self.directory: str = directory
+        self.max_loaded_branches: int = max_loaded_branches
+        # The (branch id, row) of everyone with each (first name, last name)
+        self.names: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        self.branch_ids: List[int] = []
+        # The loaded branches, least recently used first
+        self.loaded: OrderedDict[int, FamilyTree] = OrderedDict()
+
+        with open(os.path.join(directory, BRANCH_INDEX_FILE_NAME), newline="", encoding="utf-8") as index_file:
+            reader: Iterator[List[str]] = csv.reader(index_file)
+            header: Optional[List[str]] = next(reader, None)
+            if header != BRANCH_INDEX_COLUMNS:
+                raise ValueError(f"Expected the branch index header to be {','.join(BRANCH_INDEX_COLUMNS)}")
+            for branch, row, first_name, last_name in reader:
+                branch_id: int = int(branch)
+                if len(self.branch_ids) == 0 or self.branch_ids[-1] != branch_id:
+                    self.branch_ids.append(branch_id)
+                self.names.setdefault((first_name, last_name), []).append((branch_id, int(row)))
+
+    def get_branch_ids(self) -> List[int]:
+        """
+            Get the ids of every saved branch
+            :return: the branch ids, in the order they were saved
+        """
+        return list(self.branch_ids)
+
+    def get_branch(self, branch_id: int) -> FamilyTree:
+        """
+            Get a branch, loading it from its file if it is not in memory
+            :param branch_id: the branch id
+            :return: a family tree containing only the people in the branch
+        """
+        if branch_id in self.loaded:
+            self.loaded.move_to_end(branch_id)
+            return self.loaded[branch_id]
+
+        branch: FamilyTree = load_family_tree_from_csv(os.path.join(self.directory, BRANCH_FILE_NAME.format(branch_id)))
+        self.loaded[branch_id] = branch
+        if len(self.loaded) > self.max_loaded_branches:
+            self.loaded.popitem(last=False)
+        return branch
+
+    def find_people(self, first_name: str, last_name: str) -> List[Tuple[FamilyTree, Person]]:
+        """
+            Find everyone with a name, loading only the branches they are in
+            :param first_name: the first name
+            :param last_name: the last name
+            :return: a (branch, person) pair for each person with the name
+        """
+        found: List[Tuple[FamilyTree, Person]] = []
+        for branch_id, row in self.names.get((first_name, last_name), []):
+            branch: FamilyTree = self.get_branch(branch_id)
+            # People are loaded in row order, so their row is their reference in the branch
+            found.append((branch, branch.get_person_from_reference(row)))
+        return found
@@ -0,0 +1,93 @@
+# This class contains the connected component index used by FamilyTree
+# It is a union-find (disjoint set) over person references
+# A union-find can only merge components, so when a link is removed FamilyTree finds the groups
+# which are still connected and splits the component into them
+# Two people are in the same component if a chain of parent or spouse links connects them
+# This class only deals with int references, it should not know anything about the Person class
+
+from typing import Dict, List
+
+class ComponentIndex:
+    """ComponentIndex class groups person references into connected components using union-find"""
+    def __init__(self):
+        """
+            Create an empty component index
+        """
+        self.parent: List[int] = []
+        self.size: List[int] = []
+        self.members: Dict[int, List[int]] = {}
+
+    def add(self) -> int:
+        """
+            Add a new reference in its own component
+            :return: the new reference, which is also its component id
+        """
+        reference: int = len(self.parent)
+        self.parent.append(reference)
+        self.size.append(1)
+        self.members[reference] = [reference]
+        return reference
+
+    def find(self, reference: int) -> int:
+        """
+            Find the component id (root) of a reference
+            :param reference: the reference to look up
+            :return: the component id
+        """
+        parent: List[int] = self.parent
+        while parent[reference] != reference:
+            # Path halving, point every other node at its grandparent
+            parent[reference] = parent[parent[reference]]
+            reference = parent[reference]
+        return reference
+
+    def union(self, reference1: int, reference2: int) -> int:
+        """
+            Merge the components of two references
+            :param reference1: first reference
+            :param reference2: second reference
+            :return: the component id of the merged component
+        """
+        root1: int = self.find(reference1)
+        root2: int = self.find(reference2)
+        if root1 == root2:
+            return root1
+
+        # Union by size, attach the smaller component under the larger one
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        self.members[root1].extend(self.members.pop(root2))
+        return root1
+
+    def split(self, component_id: int, groups: List[List[int]]) -> None:
+        """
+            Split a component into smaller components
+            :param component_id: the component id
+            :param groups: the references of each new component, together they must be every member of the component
+        """
+        root: int = self.find(component_id)
+        del self.members[root]
+        for group in groups:
+            # The group containing the old root keeps its id
+            new_root: int = root if root in group else group[0]
+            for reference in group:
+                self.parent[reference] = new_root
+            self.size[new_root] = len(group)
+            self.members[new_root] = group
+
+    def get_members(self, component_id: int) -> List[int]:
+        """
+            Get the references in a component
+            :param component_id: the component id
+            :return: the references in the component, sorted in the order they were added
+        """
+        return sorted(self.members[self.find(component_id)])
+
+    def get_component_ids(self) -> List[int]:
+        """
+            Get the ids of every component
+            :return: the component ids
+        """
+        return list(self.members.keys())
@@ -2,22 +2,76 @@
 # A brief breakdown of class functionality:
 # This class contains a menu loop from which it asks the user for the following:
 # Family member to view details
-# Option to perform which calls one of the 9 methods e.g. show_parents
+# Option to perform which calls one of the 11 methods e.g. show_parents
 # If the user wants to continue or quit
+# The family tree is loaded in the background, so the menu only waits when it needs the data
 
 import os
-from typing import List, Optional, Tuple
-from FamilyTree import FamilyTree
-from CreateTree import create_populated_family_tree
+from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
 from Person import Person
+from TreeLoader import TreeLoader
+
+# The family tree modules are imported by the loader on the background thread
+if TYPE_CHECKING:
+    from FamilyTree import FamilyTree
 
 class ConsoleMenu:
     """ConsoleMenu class represents the console menu for the family tree"""
-    def __init__(self):
+    def __init__(self, csv_path: Optional[str] = None):
+        """
+            Create a console menu and start loading and populating the family tree in the background
+            :param csv_path: the CSV file to load the family tree from, if not given the tree from CreateTree is used
+        """
+        self.csv_path: Optional[str] = csv_path
+        self.reported_stages: List[str] = []
+        self.tree_loader: TreeLoader = TreeLoader(self.load_family_tree)
+        self.tree_loader.start()
+    
+    def load_family_tree(self, report_stage: Callable[[str, "FamilyTree"], None]) -> "FamilyTree":
+        """
+            Load the family tree, this is run on the background thread
+            :param report_stage: the callback to report each loading stage reached
+            :return: the populated family tree
+        """
+        # Imported here so importing them doesn't hold up the menu
+        if self.csv_path is not None:
+            from FamilyTreeCSV import load_family_tree_from_csv
+            return load_family_tree_from_csv(self.csv_path, report_stage=report_stage)
+        
+        from CreateTree import create_populated_family_tree
+        return create_populated_family_tree()
+    
+    def wait_for_family_tree(self, stage: str = "relationships") -> "FamilyTree":
+        """
+            Wait for the family tree to reach a loading stage and print the time taken for each stage reached
+            :param stage: the stage needed, people for names only or relationships for everything
+            :return: the family tree
+        """
+        if not self.tree_loader.is_ready(stage):
+            print("Loading the family tree...")
+        
+        try:
+            family_tree: FamilyTree = self.tree_loader.wait_for(stage)
+        # The loader failed e.g. the CSV file is missing or invalid
+        except Exception as error:
+            print(f"Failed to load the family tree: {error}")
+            exit(-1)
+        
+        # Print the timings of the stages reached since the last time
+        for reached_stage, seconds in list(self.tree_loader.timings.items()):
+            if reached_stage not in self.reported_stages:
+                self.reported_stages.append(reached_stage)
+                print(f"Loaded {reached_stage} in {seconds * 1000:.1f} ms.")
+        
+        return family_tree
+    
+    @property
+    def family_tree(self) -> "FamilyTree":
         """
-            Create a console menu and initialise the family tree and populate it
+            The fully loaded family tree, waits for it to finish loading if needed
+            :return: the family tree
         """
-        self.family_tree: FamilyTree = create_populated_family_tree()
+        return self.wait_for_family_tree()
     
     def enter_loop(self) -> None:
         """
@@ -52,12 +106,20 @@ class ConsoleMenu:
             Select the family member to view their details of
             :return: the person selected
         """
+        # Only names are needed to pick someone, lineage sizes are shown if the relationships have loaded
+        family_tree: FamilyTree = self.wait_for_family_tree("people")
+        show_lineage_size: bool = self.tree_loader.is_ready("relationships")
         person_number: int = -1
         while person_number < 0:
             print("Please select a family member to view:")
             ConsoleMenu.print_divider()
-            for person in self.family_tree.people:
-                print(f"{self.family_tree.get_reference_from_person(person)+1}: {person.first_name} {person.last_name}")
+            for person in family_tree.people:
+                lineage_size: str = ""
+                if show_lineage_size:
+                    number_of_descendants: int = family_tree.get_descendant_counts(person)[0]
+                    if number_of_descendants > 0:
+                        lineage_size = f" ({number_of_descendants} {'descendants' if number_of_descendants != 1 else 'descendant'})"
+                print(f"{family_tree.get_reference_from_person(person)+1}: {person.first_name} {person.last_name}{lineage_size}")
             ConsoleMenu.print_divider()
             
             # Get the person
@@ -67,7 +129,7 @@ class ConsoleMenu:
                 person_number = int(person_number_str) - 1
                 
                 # Check number in range
-                if person_number < 0 or person_number >= len(self.family_tree.people):
+                if person_number < 0 or person_number >= len(family_tree.people):
                     print("Out of range!")
                     person_number = -1
                     continue
@@ -81,7 +143,7 @@ class ConsoleMenu:
             except KeyboardInterrupt:
                 exit(-1)
                 
-        return self.family_tree.get_person_from_reference(person_number)
+        return family_tree.get_person_from_reference(person_number)
     
     def select_option_to_perform_the_person(self, person: Person) -> None:
         """
@@ -101,6 +163,8 @@ class ConsoleMenu:
         print("7: View calendar of everyone's birthday")
         print("8: Calculate the average age at which someone dies from deceased person")
         print("9: Calculate the average number of children per person")
+        print("10: Run a relationship query e.g. parents.siblings.children - self")
+        print("11: Rank founders by number of living descendants")
         
         option_number: int = -1
         while option_number < 0:
@@ -110,7 +174,7 @@ class ConsoleMenu:
                 option_number = int(option_number_str)
                 
                 # Check number in range
-                if option_number < 1 or option_number > 9:
+                if option_number < 1 or option_number > 11:
                     print("Out of range!")
                     option_number = -1
                     continue
@@ -146,6 +210,10 @@ class ConsoleMenu:
                 self.calculate_average_age_of_death()
             case 9:
                 self.calculate_average_number_of_children()
+            case 10:
+                self.run_relationship_query(person)
+            case 11:
+                self.show_top_lineages()
             case _:
                 print("Invalid option.")
                 exit(-1)
@@ -415,4 +483,54 @@ class ConsoleMenu:
         
         print(f"The average number of children is {number_of_children_in_whole_tree / len(self.family_tree.people):.4f}.")
         
+        ConsoleMenu.print_divider()
+        
+    def run_relationship_query(self, person: Person) -> None:
+        """
+            Ask for a relationship query and show the people matching it
+            :param person: the person to run the query for
+        """
+        ConsoleMenu.print_divider()
+        print("Join relationships with dots and combine them with + (either), - (except) or & (both).")
+        print("Relationships: self, mother, father, parents, children, siblings, spouse.")
+        
+        # Ask until a valid query is given
+        people: Optional[List[Person]] = None
+        while people is None:
+            try:
+                expression: str = input("Query: ")
+                people = self.family_tree.query(person, expression)
+            # Invalid query, the error explains what was wrong
+            except ValueError as error:
+                print(f"Invalid query: {error}")
+            # Keyboard interrupt e.g. Control + C
+            except KeyboardInterrupt:
+                exit(-1)
+        
+        # Print the people found
+        if len(people) > 0:
+            print(f"{person} query \"{expression}\" found: ", end="")
+            for found_person in people:
+                print(f"{found_person}", end="")
+                if found_person != people[-1]:
+                    print(", ", end="")
+                else:
+                    print(".")
+        else:
+            print("No one found.")
+            
+        ConsoleMenu.print_divider()
+        
+    def show_top_lineages(self, number_of_founders: int = 10) -> None:
+        """
+            Show the founders (people with no known parents) with the most living descendants
+            :param number_of_founders: the number of founders to show
+        """
+        ConsoleMenu.print_divider()
+        
+        print("Founders with the most living descendants:")
+        for position, (founder, living) in enumerate(self.family_tree.top_lineages(number_of_founders), 1):
+            total, _, deceased = self.family_tree.get_descendant_counts(founder)
+            print(f"{position}: {founder} has {living} living and {deceased} deceased of {total} descendants.")
+        
         ConsoleMenu.print_divider()
\ No newline at end of file
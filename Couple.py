@@ -0,0 +1,43 @@
+# This is the Couple class which represents a union of two parents in the family tree
+# A couple is either partners (set with FamilyTree.set_partner) or two people who had children together
+# Either parent can be unknown, e.g. for children whose father is not known
+# The children of a couple are full siblings of each other
+# FamilyTree keeps the couples up to date, this class should only hold the record of the union
+
+from typing import List, Optional
+from Person import Person
+
+class Couple:
+    """Couple class represents two parents and the children they had together"""
+    def __init__(self, parent1: Optional[Person], parent2: Optional[Person]):
+        """
+            Create a new couple with no children
+            :param parent1: first parent, None if unknown
+            :param parent2: second parent, None if unknown
+        """
+        self.parent1: Optional[Person] = parent1
+        self.parent2: Optional[Person] = parent2
+        self.children: List[Person] = []
+        self.partners: bool = False
+
+    def __str__(self) -> str:
+        """
+            Returns the names of the parents when the couple is converted to a string
+            :return: the parents' names
+        """
+        return f"{self.parent1 if self.parent1 is not None else 'unknown'} and {self.parent2 if self.parent2 is not None else 'unknown'}"
+
+    def has_both_parents(self) -> bool:
+        """
+            Check if both parents are known
+            :return: if both parents are known
+        """
+        return self.parent1 is not None and self.parent2 is not None
+
+    def get_other_parent(self, parent: Person) -> Optional[Person]:
+        """
+            Get the other parent of the couple
+            :param parent: one of the parents
+            :return: the other parent, None if unknown
+        """
+        return self.parent2 if self.parent1 is parent else self.parent1
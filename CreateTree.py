@@ -42,9 +42,9 @@ def create_populated_family_tree() -> FamilyTree:
     family_tree.set_partner(john, jeanette)
     
     # Mark people as deceased
-    john.set_deceased(datetime.date(1990, 3, 23))
-    jeanette.set_deceased(datetime.date(1990, 3, 23))
-    ginny.set_deceased(datetime.date(1960, 7, 2))
+    family_tree.set_deceased(john, datetime.date(1990, 3, 23))
+    family_tree.set_deceased(jeanette, datetime.date(1990, 3, 23))
+    family_tree.set_deceased(ginny, datetime.date(1960, 7, 2))
     
     #endregion
     
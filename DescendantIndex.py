@@ -0,0 +1,124 @@
+# This class contains the descendant index used by FamilyTree
+# It counts the total, living and deceased descendants of everyone, each descendant is only counted once
+# even when they descend from someone through more than one line (pedigree collapse)
+# The counts are built in a single pass on the first query, working up from the last generation
+# so each person's descendants are built from their children's
+# After that adding someone or marking them deceased updates only their ancestors' counts, with one walk up the tree,
+# while changing parents or loading many people marks the index out of date so it is rebuilt on the next query
+# People added before the first query are only counted by that first build, so building a family tree stays O(N)
+
+import heapq
+from typing import Dict, List, Set, Tuple
+from Person import Person
+
+class DescendantIndex:
+    """DescendantIndex class stores the number of descendants of everyone in the family tree"""
+    def __init__(self):
+        """
+            Create an empty descendant index, the counts are built on the first query
+        """
+        self.total: Dict[Person, int] = {}
+        self.living: Dict[Person, int] = {}
+        self.up_to_date: bool = False
+
+    @staticmethod
+    def get_ancestors(person: Person) -> Set[Person]:
+        """
+            Get every known ancestor of a person, each only once
+            :param person: the person
+            :return: their ancestors
+        """
+        ancestors: Set[Person] = {parent for parent in (person.mother, person.father) if parent is not None}
+        pending: List[Person] = list(ancestors)
+        while pending:
+            ancestor: Person = pending.pop()
+            for parent in (ancestor.mother, ancestor.father):
+                if parent is not None and parent not in ancestors:
+                    ancestors.add(parent)
+                    pending.append(parent)
+        return ancestors
+
+    def add(self, person: Person) -> None:
+        """
+            Add a person and count them as a descendant of their ancestors, if the index is up to date
+            :param person: the person, their parents must already be in the index
+        """
+        self.total[person] = 0
+        self.living[person] = 0
+        if not self.up_to_date:
+            return
+
+        living: int = 1 if person.date_of_death is None else 0
+        for ancestor in DescendantIndex.get_ancestors(person):
+            self.total[ancestor] += 1
+            self.living[ancestor] += living
+
+    def set_deceased(self, person: Person) -> None:
+        """
+            Move a person from the living to the deceased descendants of their ancestors, if the index is up to date
+            :param person: the person who was living and has died
+        """
+        if not self.up_to_date:
+            return
+
+        for ancestor in DescendantIndex.get_ancestors(person):
+            self.living[ancestor] -= 1
+
+    def update(self) -> None:
+        """
+            Mark the index as out of date, e.g. after someone's parents have changed or many people have been loaded
+        """
+        self.up_to_date = False
+
+    def build(self, generations: Dict[int, Dict[Person, None]], children: Dict[Person, List[Person]]) -> None:
+        """
+            Rebuild the counts from the last generation to the first
+            Each person's descendants are kept as a bitset of bit positions so descendants reached twice are counted once
+            :param generations: the people in each generation, everyone is in a later generation than their parents
+            :param children: each person's children
+        """
+        # People in later generations get lower bit positions, so the bitsets of people with few descendants stay small
+        order: List[Person] = [person for generation in sorted(generations, reverse=True) for person in generations[generation]]
+        positions: Dict[Person, int] = {person: position for position, person in enumerate(order)}
+        living_bytes: bytearray = bytearray((len(order) + 7) // 8)
+        for position, person in enumerate(order):
+            if person.date_of_death is None:
+                living_bytes[position >> 3] |= 1 << (position & 7)
+        living_mask: int = int.from_bytes(living_bytes, "little")
+
+        # A person's descendants are only needed until both of their parents have been counted
+        descendants: Dict[Person, int] = {}
+        parents_left: Dict[Person, int] = {}
+        for person in order:
+            person_descendants: int = 0
+            for child in children[person]:
+                person_descendants |= (1 << positions[child]) | descendants[child]
+                parents_left[child] -= 1
+                if parents_left[child] == 0:
+                    del descendants[child]
+
+            self.total[person] = person_descendants.bit_count()
+            self.living[person] = (person_descendants & living_mask).bit_count()
+            number_of_parents: int = (person.mother is not None) + (person.father is not None)
+            if number_of_parents > 0:
+                descendants[person] = person_descendants
+                parents_left[person] = number_of_parents
+
+        self.up_to_date = True
+
+    def get_counts(self, person: Person) -> Tuple[int, int, int]:
+        """
+            Get the number of descendants of a person, the index must be up to date
+            :param person: the person
+            :return: the (total, living, deceased) number of descendants
+        """
+        return self.total[person], self.living[person], self.total[person] - self.living[person]
+
+    def get_top(self, people: List[Person], k: int) -> List[Tuple[Person, int]]:
+        """
+            Get the people with the most living descendants, the index must be up to date
+            :param people: the people to rank
+            :param k: the number of people to return
+            :return: up to k (person, living descendants) pairs, most living descendants first
+        """
+        return [(person, self.living[person]) for person in heapq.nlargest(k, people, key=self.living.__getitem__)]
@@ -4,33 +4,396 @@
 # This class should not contain any logic not related to manipulating the family tree
 # Or looking up relationships in the family tree
 # User facing code e.g. printing to the terminal, should be carried out in ConsoleMenu
+# The indexes (e.g. the connected component index) are kept up to date by add_person, set_parents, set_partner and set_deceased
 
 import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Self, Set, Tuple
+from BirthDateIndex import BirthDateIndex
+from ComponentIndex import ComponentIndex
+from Couple import Couple
+from DescendantIndex import DescendantIndex
+from GenerationIndex import GenerationIndex
+from LifespanIndex import LifespanIndex
+from LineageIndex import LineageIndex
 from Person import Person
+from RelationshipQuery import RelationshipQuery
 
 class FamilyTree:
     """FamilyTree class stores the family tree and methods to find relationships within it"""
     def __init__(self):
         self.people = []
+        self.references: Dict[Person, int] = {}
+        self.components: ComponentIndex = ComponentIndex()
+        self.branches: Dict[int, Self] = {}
+        self.children: Dict[Person, List[Person]] = {}
+        # Couples are stored by their parents' references (-1 for an unknown parent), smallest first
+        self.couples: Dict[Tuple[int, int], Couple] = {}
+        self.couples_of: Dict[Person, List[Couple]] = {}
+        self.parent_couples: Dict[Person, Couple] = {}
+        self.lifespans: LifespanIndex = LifespanIndex()
+        self.birth_dates: BirthDateIndex = BirthDateIndex()
+        self.lineages: LineageIndex = LineageIndex()
+        self.generations: GenerationIndex = GenerationIndex()
+        self.descendants: DescendantIndex = DescendantIndex()
     
     def add_person(self, person: Person) -> Person:
         """
             Add a person to the list of people
-            :param person: person to add
+            :param person: person to add, their parents must already be in the family tree
             :return: the person, this used so you have a reference to the person for calling code like set_partner
         """
+        for parent in (person.mother, person.father):
+            if parent is not None and parent not in self.references:
+                raise ValueError(f"{parent} must be added to the family tree before {person}")
+        
+        self.references[person] = len(self.people)
         self.people.append(person)
+        
+        # Join the person's component with their parents' components and record them as a child
+        reference: int = self.components.add()
+        self.children[person] = []
+        self.couples_of[person] = []
+        for parent in (person.mother, person.father):
+            if parent is not None:
+                self.link_components(reference, self.references[parent])
+                self.children[parent].append(person)
+        
+        # Add them to their parents' couple
+        if person.mother is not None or person.father is not None:
+            couple: Couple = self.get_couple(person.mother, person.father)
+            couple.children.append(person)
+            self.parent_couples[person] = couple
+        
+        self.lifespans.add(person)
+        self.birth_dates.add(person)
+        self.lineages.add(person)
+        self.generations.add(person)
+        self.descendants.add(person)
+        
         return person
 
+    def set_parents(self, person: Person, mother: Optional[Person], father: Optional[Person]) -> None:
+        """
+            Set the parents of someone already in the family tree, e.g. when the parents were added after them
+            :param person: the person
+            :param mother: their mother, who must be in the family tree
+            :param father: their father, who must be in the family tree
+        """
+        for parent in (mother, father):
+            if parent is not None and parent not in self.references:
+                raise ValueError(f"{parent} must be added to the family tree before they can be set as a parent")
+        
+        # Check they would not become their own ancestor, which is only possible if a new parent is one of their descendants
+        if person is mother or person is father:
+            raise ValueError(f"{person} can not be their own ancestor")
+        if len(self.children[person]) > 0:
+            new_parents: Set[Person] = {parent for parent in (mother, father) if parent is not None}
+            descendants: List[Person] = [person]
+            checked: Set[Person] = {person}
+            while descendants:
+                for child in self.children[descendants.pop()]:
+                    if child in new_parents:
+                        raise ValueError(f"{person} can not be their own ancestor")
+                    if child not in checked:
+                        checked.add(child)
+                        descendants.append(child)
+        
+        if self.replace_parents(person, mother, father):
+            self.split_component(person)
+        self.generations.update(person, self.children)
+        self.birth_dates.update_generations()
+        self.descendants.update()
+    
+    def set_parents_of_many(self, links: Iterable[Tuple[Person, Optional[Person], Optional[Person]]]) -> None:
+        """
+            Set the parents of many people at once, e.g. when loading a family tree
+            Generations are calculated once for everyone after all of the parents are set,
+            so this takes O(N) time for N people in the family tree however the links are ordered
+            :param links: the (person, mother, father) of each person to change, everyone must be in the family tree
+            :raises ValueError: if a parent is not in the family tree or someone would become their own ancestor
+        """
+        new_parents: Dict[Person, Tuple[Optional[Person], Optional[Person]]] = {}
+        for person, mother, father in links:
+            for parent in (mother, father):
+                if parent is not None and parent not in self.references:
+                    raise ValueError(f"{parent} must be added to the family tree before they can be set as a parent")
+            new_parents[person] = (mother, father)
+        
+        # Order everyone before changing anything, so nothing is changed if someone would become their own ancestor
+        order: List[Person] = self.get_parents_first_order(new_parents)
+        # Components are split once at the end, after every new link has been made
+        removed_links: List[Person] = [person for person, (mother, father) in new_parents.items() if self.replace_parents(person, mother, father)]
+        split_component_ids: Set[int] = set()
+        for person in removed_links:
+            if self.get_component_id(person) not in split_component_ids:
+                split_component_ids.add(self.get_component_id(person))
+                self.split_component(person)
+        self.generations.build(order)
+        self.birth_dates.update_generations()
+        self.descendants.update()
+    
+    def get_parents_first_order(self, new_parents: Dict[Person, Tuple[Optional[Person], Optional[Person]]]) -> List[Person]:
+        """
+            Order everyone in the family tree so parents come before their children, in one pass (Kahn's algorithm)
+            :param new_parents: the (mother, father) to use instead of the current parents of some people
+            :return: everyone in the family tree, parents before their children
+            :raises ValueError: if someone would be their own ancestor
+        """
+        parents_left: Dict[Person, int] = {}
+        children: Dict[Person, List[Person]] = {person: [] for person in self.people}
+        order: List[Person] = []
+        for person in self.people:
+            parents: List[Person] = [parent for parent in new_parents.get(person, (person.mother, person.father)) if parent is not None]
+            parents_left[person] = len(parents)
+            for parent in parents:
+                children[parent].append(person)
+            if len(parents) == 0:
+                order.append(person)
+        
+        # Everyone in the order has had all of their parents placed before them
+        for person in order:
+            for child in children[person]:
+                parents_left[child] -= 1
+                if parents_left[child] == 0:
+                    order.append(child)
+        
+        if len(order) < len(self.people):
+            person = next(person for person, left in parents_left.items() if left > 0)
+            raise ValueError(f"{person} can not be their own ancestor")
+        return order
+    
+    def replace_parents(self, person: Person, mother: Optional[Person], father: Optional[Person]) -> bool:
+        """
+            Replace someone's parents and update the children, couples and branches, but not the generations or descendants
+            Components are only merged, call split_component if a parent link was removed
+            :param person: the person
+            :param mother: their mother, who must be in the family tree
+            :param father: their father, who must be in the family tree
+            :return: whether a parent link was removed
+        """
+        removed_link: bool = any(parent is not None and parent not in (mother, father) for parent in (person.mother, person.father))
+        
+        # Remove them from their old parents' children
+        for parent in (person.mother, person.father):
+            if parent is not None and person in self.children[parent]:
+                self.children[parent].remove(person)
+        if person in self.parent_couples:
+            old_couple: Couple = self.parent_couples.pop(person)
+            old_couple.children.remove(person)
+            if len(old_couple.children) == 0 and not old_couple.partners:
+                self.remove_couple(old_couple)
+        
+        person.mother = mother
+        person.father = father
+        reference: int = self.references[person]
+        for parent in (mother, father):
+            if parent is not None:
+                self.link_components(reference, self.references[parent])
+                if person not in self.children[parent]:
+                    self.children[parent].append(person)
+        if mother is not None or father is not None:
+            couple: Couple = self.get_couple(mother, father)
+            couple.children.append(person)
+            self.parent_couples[person] = couple
+        
+        # The cached branch is stale even when no components were linked, e.g. when the parents are removed
+        self.branches.pop(self.get_component_id(person), None)
+        return removed_link
+    
+    def split_component(self, person: Person) -> None:
+        """
+            Recalculate the component of a person after a link in it was removed, splitting it if it is no longer connected
+            This takes O(size of the component) time
+            :param person: a person in the component
+        """
+        component_id: int = self.get_component_id(person)
+        self.branches.pop(component_id, None)
+        
+        # Find the groups of members which are still connected to each other
+        groups: List[List[int]] = []
+        grouped: Set[Person] = set()
+        for reference in self.components.get_members(component_id):
+            member: Person = self.people[reference]
+            if member in grouped:
+                continue
+            grouped.add(member)
+            group: List[int] = [reference]
+            pending: List[Person] = [member]
+            while pending:
+                for _, relative in self.get_relatives(pending.pop()):
+                    if relative not in grouped:
+                        grouped.add(relative)
+                        group.append(self.references[relative])
+                        pending.append(relative)
+            groups.append(group)
+        
+        if len(groups) > 1:
+            self.components.split(component_id, groups)
+    
     def set_partner(self, person1: Person, person2: Person) -> None:
         """
-            Set two people as partners
+            Set two people as partners, e.g. when someone remarries
+            Anyone either of them was partners with before is left without a spouse,
+            the earlier partnership is still recorded in their couple
             :param person1: first person
             :param person2: second person
         """
+        for person, partner in ((person1, person2), (person2, person1)):
+            old_partner: Optional[Person] = person.spouse
+            if old_partner is not None and old_partner is not partner and old_partner.spouse is person:
+                old_partner.spouse = None
         person1.spouse = person2
         person2.spouse = person1
+        self.add_partners(person1, person2)
+    
+    def add_partners(self, person1: Person, person2: Person) -> Couple:
+        """
+            Record two people as partners without changing their current spouse, e.g. for a previous marriage
+            :param person1: first person
+            :param person2: second person
+            :return: their couple
+        """
+        couple: Couple = self.get_couple(person1, person2)
+        couple.partners = True
+        self.link_components(self.references[person1], self.references[person2])
+        return couple
+    
+    def get_couple(self, parent1: Optional[Person], parent2: Optional[Person]) -> Couple:
+        """
+            Get the couple of two parents, creating it if they are not a couple yet
+            :param parent1: first parent, None if unknown
+            :param parent2: second parent, None if unknown
+            :return: the couple
+        """
+        key: Tuple[int, int] = self.get_couple_key(parent1, parent2)
+        couple: Optional[Couple] = self.couples.get(key)
+        if couple is None:
+            couple = Couple(parent1, parent2)
+            self.couples[key] = couple
+            for parent in (parent1, parent2):
+                if parent is not None:
+                    self.couples_of[parent].append(couple)
+        return couple
+    
+    def get_couple_key(self, parent1: Optional[Person], parent2: Optional[Person]) -> Tuple[int, int]:
+        """
+            Get the key of a couple in the couples dict, the same whichever order the parents are given in
+            :param parent1: first parent, None if unknown
+            :param parent2: second parent, None if unknown
+            :return: the sorted references of the parents, -1 for an unknown parent
+        """
+        reference1: int = self.references[parent1] if parent1 is not None else -1
+        reference2: int = self.references[parent2] if parent2 is not None else -1
+        return min(reference1, reference2), max(reference1, reference2)
+    
+    def remove_couple(self, couple: Couple) -> None:
+        """
+            Remove a couple which has no children and are not partners
+            :param couple: the couple
+        """
+        del self.couples[self.get_couple_key(couple.parent1, couple.parent2)]
+        for parent in (couple.parent1, couple.parent2):
+            if parent is not None:
+                self.couples_of[parent].remove(couple)
+    
+    def get_couples(self, person: Person) -> List[Couple]:
+        """
+            Get every couple a person is a parent or partner in
+            :param person: the person
+            :return: their couples, in the order they were formed
+        """
+        return list(self.couples_of[person])
+    
+    def get_partners(self, person: Person) -> List[Person]:
+        """
+            Get everyone a person has been partners with, including previous partners
+            :param person: the person
+            :return: their partners, in the order they were set
+        """
+        return [couple.get_other_parent(person) for couple in self.couples_of[person] if couple.partners]
+    
+    def set_deceased(self, person: Person, date_of_death: datetime.date) -> None:
+        """
+            Set the date a person died on, use this instead of Person.set_deceased so the indexes are updated
+            :param person: the person who died
+            :param date_of_death: date of death
+        """
+        was_living: bool = person.date_of_death is None
+        person.set_deceased(date_of_death)
+        self.lifespans.update()
+        self.birth_dates.update()
+        if was_living:
+            self.descendants.set_deceased(person)
+        self.branches.pop(self.get_component_id(person), None)
+    
+    def link_components(self, reference1: int, reference2: int) -> None:
+        """
+            Merge the components of two people and drop any cached branches for them
+            :param reference1: reference of the first person
+            :param reference2: reference of the second person
+        """
+        self.branches.pop(self.components.find(reference1), None)
+        self.branches.pop(self.components.find(reference2), None)
+        self.components.union(reference1, reference2)
+    
+    def get_component_id(self, person: Person) -> int:
+        """
+            Get the id of the connected component (branch) a person belongs to
+            :param person: the person
+            :return: the component id, people linked by any chain of parent or spouse links share the same id
+        """
+        return self.components.find(self.references[person])
+    
+    def get_branch(self, person: Person) -> Self:
+        """
+            Get the branch a person belongs to as its own family tree, the branch is built once and cached
+            The branch shares the Person objects with this tree and should be treated as read only
+            It is a copy built from this tree, so this tree has to be fully loaded, to load one branch
+            without the rest of the tree save the branches with save_branches_to_csv and load them with BranchStore
+            :param person: a person in the branch
+            :return: a family tree containing only the people in the person's branch
+        """
+        component_id: int = self.get_component_id(person)
+        branch: Optional[Self] = self.branches.get(component_id)
+        if branch is None:
+            branch = self.create_branch(component_id)
+            self.branches[component_id] = branch
+        return branch
+    
+    def get_branches(self) -> List[Self]:
+        """
+            Split the family tree into its unrelated branches
+            :return: a family tree for each connected component
+        """
+        return [self.get_branch(self.people[component_id]) for component_id in self.components.get_component_ids()]
+    
+    def create_branch(self, component_id: int) -> Self:
+        """
+            Build a new family tree from the people in one component
+            :param component_id: the component id
+            :return: the family tree for the component
+        """
+        branch: Self = FamilyTree()
+        for reference in self.components.get_members(component_id):
+            # Parents have to be added before their children
+            pending: List[Person] = [self.people[reference]]
+            while pending:
+                person: Person = pending[-1]
+                if person in branch.references:
+                    pending.pop()
+                    continue
+                missing_parents: List[Person] = [parent for parent in (person.mother, person.father) if parent is not None and parent not in branch.references]
+                if missing_parents:
+                    pending.extend(missing_parents)
+                else:
+                    branch.add_person(pending.pop())
+        
+        # Add the partners in the branch
+        for person in branch.people:
+            for partner in self.get_partners(person):
+                branch.add_partners(person, partner)
+        
+        return branch
         
     def get_person_from_reference(self, person_reference: int) -> Person:
         """
@@ -46,7 +409,9 @@ class FamilyTree:
             :param person: the person object
             :return: the int reference to the person in the list of people
             """
-        return self.people.index(person)
+        if person not in self.references:
+            raise ValueError(f"{person} is not in the family tree")
+        return self.references[person]
     
     def get_parents(self, person: Person) -> Tuple[Optional[Person], Optional[Person]]:
         """
@@ -84,31 +449,26 @@ class FamilyTree:
             :param include_half_siblings: if it should include half siblings
             :return: the siblings of the person in the format (full siblings, half siblings)
         """
-        siblings = []
-        
-        # Get parents
-        mother, father = self.get_parents(person)
-        
-        # Get parent's children - siblings
-        siblings = self.get_children(mother)
-        siblings += self.get_children(father)
+        full_siblings: List[Person] = []
+        half_siblings: List[Person] = []
+        couple: Optional[Couple] = self.parent_couples.get(person)
+        if couple is None:
+            return full_siblings, half_siblings
         
-        # Remove duplicate entries
-        siblings = list(dict.fromkeys(siblings))
-        
-        full_siblings = []
-        half_siblings = []
-        
-        # Remove self from the list
-        if person in siblings:
-            siblings.remove(person)
+        # The parents' children are full siblings if both parents are known, otherwise half siblings
+        siblings: List[Person] = [sibling for sibling in couple.children if sibling is not person]
+        if couple.has_both_parents():
+            full_siblings = siblings
+        elif include_half_siblings:
+            half_siblings = siblings
         
-        # Add to the correct list
-        for sibling in siblings:
-            if (sibling.mother == mother and sibling.mother != None) and (sibling.father == father and sibling.father != None):
-                full_siblings.append(sibling)
-            elif include_half_siblings and ((sibling.mother == mother and sibling.mother != None) or (sibling.father == father and sibling.father != None)):
-                half_siblings.append(sibling)
+        # Add the children each parent had in their other couples
+        if include_half_siblings:
+            for parent in (person.mother, person.father):
+                if parent is not None:
+                    for other_couple in self.couples_of[parent]:
+                        if other_couple is not couple:
+                            half_siblings.extend(other_couple.children)
                     
         return full_siblings, half_siblings
     
@@ -119,14 +479,11 @@ class FamilyTree:
             :param person: the person to find their children
             :return: the children of them
         """
-        children: List[Person] = []
+        if person is None or person not in self.children:
+            return []
         
-        # Find all children who share the father or mother
-        for i in self.people:
-            if (i.mother == person and i.mother is not None) or (i.father == person and i.father is not None):
-                children.append(i)
-                
-        return children
+        # Copy so calling code can't change the stored children
+        return list(self.children[person])
     
     def get_grandchildren(self, person: Person) -> List[Person]:
         """
@@ -185,6 +542,192 @@ class FamilyTree:
         
         return cousins
     
+    def get_relatives(self, person: Person) -> Iterator[Tuple[str, Person]]:
+        """
+            Get everyone directly linked to a person by a parent, child or spouse link
+            :param person: the person
+            :return: pairs of the link label (mother, father, child or spouse) and the relative
+        """
+        if person.mother is not None:
+            yield "mother", person.mother
+        if person.father is not None:
+            yield "father", person.father
+        for partner in self.get_partners(person):
+            yield "spouse", partner
+        for child in self.children[person]:
+            yield "child", child
+    
+    def get_link_label(self, person: Person, relative: Person) -> str:
+        """
+            Get the label of the link from a person to a directly linked relative
+            :param person: the person
+            :param relative: the relative
+            :return: mother, father, child or spouse
+        """
+        if person.mother is relative:
+            return "mother"
+        if person.father is relative:
+            return "father"
+        if relative in self.get_partners(person):
+            return "spouse"
+        return "child"
+    
+    def find_path(self, person1: Person, person2: Person, max_hops: int = 20) -> Optional[List[Tuple[str, Person]]]:
+        """
+            Find the shortest chain of parent, child and spouse links between two people
+            This is a bidirectional breadth first search which always expands the smaller frontier
+            :param person1: the person to start from
+            :param person2: the person to reach
+            :param max_hops: the maximum number of links in the path
+            :return: the path as (link label, person reached) pairs e.g. [("mother", m), ("spouse", s), ("child", person2)],
+                an empty list if they are the same person or None if there is no path within max_hops
+        """
+        if person1 is person2:
+            return []
+        
+        # Each side maps the people it has reached to the neighbouring person on the way back to where it started
+        forward: Dict[Person, Optional[Person]] = {person1: None}
+        backward: Dict[Person, Optional[Person]] = {person2: None}
+        forward_frontier: List[Person] = [person1]
+        backward_frontier: List[Person] = [person2]
+        forward_depth: Dict[Person, int] = {person1: 0}
+        backward_depth: Dict[Person, int] = {person2: 0}
+        hops: int = 0
+        
+        while forward_frontier and backward_frontier and hops < max_hops:
+            # Expand the smaller frontier by one level
+            expand_forward: bool = len(forward_frontier) <= len(backward_frontier)
+            visited, other_visited = (forward, backward) if expand_forward else (backward, forward)
+            depth, other_depth = (forward_depth, backward_depth) if expand_forward else (backward_depth, forward_depth)
+            frontier: List[Person] = forward_frontier if expand_forward else backward_frontier
+            
+            next_frontier: List[Person] = []
+            meeting_person: Optional[Person] = None
+            meeting_length: int = max_hops + 1
+            for person in frontier:
+                for _, relative in self.get_relatives(person):
+                    if relative in visited:
+                        continue
+                    visited[relative] = person
+                    depth[relative] = depth[person] + 1
+                    next_frontier.append(relative)
+                    
+                    # Keep the shortest meeting point found on this level
+                    if relative in other_visited and depth[relative] + other_depth[relative] < meeting_length:
+                        meeting_person = relative
+                        meeting_length = depth[relative] + other_depth[relative]
+            hops += 1
+            
+            if meeting_person is not None:
+                return self.join_path(meeting_person, forward, backward) if meeting_length <= max_hops else None
+            
+            if expand_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        
+        return None
+    
+    def join_path(self, meeting_person: Person, forward: Dict[Person, Optional[Person]], backward: Dict[Person, Optional[Person]]) -> List[Tuple[str, Person]]:
+        """
+            Join the two halves of a bidirectional search into a labelled path
+            :param meeting_person: the person both searches reached
+            :param forward: the people reached from the start mapped to the previous person
+            :param backward: the people reached from the end mapped to the next person
+            :return: the labelled path from the start to the end
+        """
+        # Walk back to the start, then forwards to the end
+        people: List[Person] = []
+        person: Optional[Person] = meeting_person
+        while person is not None:
+            people.append(person)
+            person = forward[person]
+        people.reverse()
+        person = backward[meeting_person]
+        while person is not None:
+            people.append(person)
+            person = backward[person]
+        
+        return [(self.get_link_label(people[i - 1], people[i]), people[i]) for i in range(1, len(people))]
+    
+    def query(self, person: Person, expression: str) -> List[Person]:
+        """
+            Run a relationship query for a person, e.g. parents.siblings.children - self finds their cousins
+            Steps are joined with dots and paths are combined with + (union), - (difference) and & (intersection)
+            :param person: the person the query starts from
+            :param expression: the query, see RelationshipQuery for the steps available
+            :return: the people matching the query
+            :raises ValueError: if the query is not valid
+        """
+        return RelationshipQuery.compile(expression).run(self, person)
+    
+    def get_people_with_surname(self, surname: str) -> List[Person]:
+        """
+            Get everyone with a surname
+            :param surname: the surname e.g. Emmersohn
+            :return: the people with the surname
+        """
+        return self.lineages.get_people_with_surname(surname)
+    
+    def get_surnames(self) -> Dict[str, int]:
+        """
+            Get every surname in the family tree
+            :return: a dict mapping each surname to the number of people with it
+        """
+        return {surname: len(people) for surname, people in self.lineages.surnames.items()}
+    
+    def get_patrilineal_line(self, person: Person) -> List[Person]:
+        """
+            Get the direct male line of a person
+            :param person: the person
+            :return: their father, father's father and so on, as far as is known
+        """
+        return self.lineages.get_line(person, "patrilineal")[1:]
+    
+    def get_matrilineal_line(self, person: Person) -> List[Person]:
+        """
+            Get the direct female line of a person
+            :param person: the person
+            :return: their mother, mother's mother and so on, as far as is known
+        """
+        return self.lineages.get_line(person, "matrilineal")[1:]
+    
+    def get_generation(self, person: Person) -> Tuple[int, int]:
+        """
+            Get the generation of a person, founders with no known parents are generation 0
+            :param person: the person
+            :return: the (min, max) generation, these differ when their parents are from different generations
+        """
+        return self.generations.get_generation(person)
+    
+    def people_in_generation(self, generation: int) -> List[Person]:
+        """
+            Get everyone in a generation, people are grouped by their max generation
+            :param generation: the generation, 0 for founders
+            :return: the people in the generation
+        """
+        return self.generations.get_people_in_generation(generation)
+    
+    def get_descendant_counts(self, person: Person) -> Tuple[int, int, int]:
+        """
+            Get the number of descendants of a person, everyone is counted once even if they descend through more than one line
+            :param person: the person
+            :return: the number of descendants in the format (total, living, deceased)
+        """
+        if not self.descendants.up_to_date:
+            self.descendants.build(self.generations.people, self.children)
+        return self.descendants.get_counts(person)
+    
+    def top_lineages(self, k: int) -> List[Tuple[Person, int]]:
+        """
+            Rank the founders (people with no known parents) by their number of living descendants
+            :param k: the number of founders to return
+            :return: up to k founders and their number of living descendants, most living descendants first
+        """
+        if not self.descendants.up_to_date:
+            self.descendants.build(self.generations.people, self.children)
+        return self.descendants.get_top(self.people_in_generation(0), k)
+    
     def get_birthdays(self) -> List[Tuple[Person, int, int]]:
         """
             Return a list of everyone's birthdays
@@ -206,4 +749,66 @@ class FamilyTree:
             if i.date_of_death is not None:
                 deceased.append(i)
                 
-        return deceased
\ No newline at end of file
+        return deceased
+    
+    def alive_on(self, date: datetime.date) -> List[Person]:
+        """
+            Return a list of people alive on a date
+            The first call after someone is added or marked deceased with set_deceased rebuilds the index in O(N log N) time
+            :param date: the date, people born or died on the date are counted as alive
+            :return: a list of people alive on the date
+        """
+        return self.lifespans.alive_on(date)
+    
+    def population_by_year(self, start_year: int, end_year: int) -> Dict[int, int]:
+        """
+            Return the number of people alive in each year
+            This uses the same index as alive_on, so both see the same lifespans
+            :param start_year: the first year
+            :param end_year: the last year
+            :return: a dict mapping each year to the number of people alive at some point during it
+        """
+        return self.lifespans.population_by_year(start_year, end_year)
+    
+    def born_between(self, start: datetime.date, end: datetime.date) -> List[Person]:
+        """
+            Return a list of people born between two dates
+            :param start: the first date, inclusive
+            :param end: the last date, inclusive
+            :return: a list of people born in the range, ordered by date of birth
+        """
+        return self.birth_dates.born_between(start, end)
+    
+    def get_age_distribution(self, date: Optional[datetime.date] = None, bucket_size: int = 10) -> Dict[int, int]:
+        """
+            Return the number of people alive on a date in each age bracket
+            :param date: the date to calculate ages on, defaults to today
+            :param bucket_size: the number of years in each bracket, by default it groups by decade
+            :return: a dict mapping the first age of each bracket to the number of people in it
+        """
+        return self.birth_dates.get_age_distribution(date, bucket_size)
+    
+    def get_age_at_death_distribution(self, bucket_size: int = 10) -> Dict[int, int]:
+        """
+            Return the number of deceased people who died in each age bracket
+            :param bucket_size: the number of years in each bracket, by default it groups by decade
+            :return: a dict mapping the first age of each bracket to the number of people who died in it
+        """
+        return self.birth_dates.get_age_at_death_distribution(bucket_size)
+    
+    def get_age_distribution_by_generation(self, date: Optional[datetime.date] = None, bucket_size: int = 10) -> Dict[int, Dict[int, int]]:
+        """
+            Return the number of people alive on a date in each age bracket, for each generation
+            :param date: the date to calculate ages on, defaults to today
+            :param bucket_size: the number of years in each bracket, by default it groups by decade
+            :return: a dict mapping each generation to a dict of the first age of each bracket and the number of people in it
+        """
+        return self.birth_dates.get_age_distribution_by_generation(self.generations.generations, date, bucket_size)
+    
+    def get_age_at_death_distribution_by_generation(self, bucket_size: int = 10) -> Dict[int, Dict[int, int]]:
+        """
+            Return the number of deceased people who died in each age bracket, for each generation
+            :param bucket_size: the number of years in each bracket, by default it groups by decade
+            :return: a dict mapping each generation to a dict of the first age of each bracket and the number of people who died in it
+        """
+        return self.birth_dates.get_age_at_death_distribution_by_generation(self.generations.generations, bucket_size)
\ No newline at end of file
@@ -0,0 +1,174 @@
+# This file contains the CSV loader and saver for the family tree
+# Each row of the CSV file is one person, people are linked to their parents and spouse by id
+# Rows are read and written in fixed size chunks so memory use does not depend on the size of the file
+# Parents and spouses are linked after everyone has been loaded, so rows can be in any order
+# A family tree can also be saved as one file per branch, with an index file of everyone's name and branch,
+# so BranchStore can load only the branch needed for a lookup
+
+import csv
+import datetime
+from itertools import islice
+import os
+from typing import Callable, Dict, Iterator, List, Optional
+from FamilyTree import FamilyTree
+from Person import Person
+from SimplifiedSex import SimplifiedSex
+
+# The columns of the CSV file, in order
+COLUMNS: List[str] = ["id", "first_name", "last_name", "sex", "date_of_birth", "date_of_death", "mother_id", "father_id", "spouse_id"]
+
+# The columns of the branch index file, in order
+BRANCH_INDEX_COLUMNS: List[str] = ["branch", "row", "first_name", "last_name"]
+
+# The name of the branch index file and of each branch file
+BRANCH_INDEX_FILE_NAME: str = "branches.csv"
+BRANCH_FILE_NAME: str = "branch_{}.csv"
+
+# The number of rows read or written at a time
+DEFAULT_CHUNK_SIZE: int = 10000
+
+def load_family_tree_from_csv(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, report_stage: Optional[Callable[[str, FamilyTree], None]] = None) -> FamilyTree:
+    """
+        Create a family tree from a CSV file (loader)
+        Two people are only linked as spouses if both of their rows name each other
+        :param path: the path of the CSV file, which must have a header row with the columns in COLUMNS
+        :param chunk_size: the number of rows to read at a time
+        :param report_stage: optional callback, called with "people" once everyone has been added and before they are linked
+        :return: the populated family tree
+        :raises ValueError: if the header is wrong, a row has an unknown sex or links to an id which is not in the file
+    """
+    family_tree: FamilyTree = FamilyTree()
+    sexes: Dict[str, SimplifiedSex] = {sex.value: sex for sex in SimplifiedSex}
+
+    # The id columns are kept as lists and resolved once everyone has been loaded
+    ids: List[str] = []
+    mother_ids: List[str] = []
+    father_ids: List[str] = []
+    spouse_ids: List[str] = []
+
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        reader: Iterator[List[str]] = csv.reader(csv_file)
+        header: Optional[List[str]] = next(reader, None)
+        if header != COLUMNS:
+            raise ValueError(f"Expected the CSV header to be {','.join(COLUMNS)}")
+
+        while True:
+            chunk: List[List[str]] = list(islice(reader, chunk_size))
+            if len(chunk) == 0:
+                break
+
+            for person_id, first_name, last_name, sex, date_of_birth, date_of_death, mother_id, father_id, spouse_id in chunk:
+                if sex not in sexes:
+                    raise ValueError(f"Person {person_id} has an unknown sex {sex}, expected one of {','.join(sexes)}")
+                person: Person = Person(first_name, last_name, sexes[sex], datetime.date.fromisoformat(date_of_birth))
+                if date_of_death:
+                    person.set_deceased(datetime.date.fromisoformat(date_of_death))
+                family_tree.add_person(person)
+
+                ids.append(person_id)
+                mother_ids.append(mother_id)
+                father_ids.append(father_id)
+                spouse_ids.append(spouse_id)
+
+    if report_stage is not None:
+        report_stage("people", family_tree)
+
+    # Link everyone to their parents and then their spouses, people are in the same order as the ids
+    people_by_id: Dict[str, Person] = dict(zip(ids, family_tree.people))
+    if len(people_by_id) != len(ids):
+        raise ValueError("Every person in the CSV file must have a different id")
+    # Parents are set together so generations are calculated once, whichever order the rows are in
+    family_tree.set_parents_of_many(
+        (person, get_person_from_id(people_by_id, mother_id, person_id), get_person_from_id(people_by_id, father_id, person_id))
+        for person_id, person, mother_id, father_id in zip(ids, family_tree.people, mother_ids, father_ids)
+        if mother_id or father_id
+    )
+    for person_id, person, spouse_id in zip(ids, family_tree.people, spouse_ids):
+        # Couples are listed on both rows, so only link them if both rows name each other and only the first time
+        spouse: Optional[Person] = get_person_from_id(people_by_id, spouse_id, person_id)
+        if spouse is not None and spouse_ids[family_tree.references[spouse]] == person_id and person.spouse is not spouse:
+            family_tree.set_partner(person, spouse)
+
+    return family_tree
+
+def get_person_from_id(people_by_id: Dict[str, Person], person_id: str, linked_from_id: str) -> Optional[Person]:
+    """
+        Look up a person linked to from another row
+        :param people_by_id: everyone loaded, by id
+        :param person_id: the id to look up, empty if it is unknown
+        :param linked_from_id: the id of the row linking to them, used in the error message
+        :return: the person or None if the id is empty
+        :raises ValueError: if there is no one with the id
+    """
+    if not person_id:
+        return None
+    if person_id not in people_by_id:
+        raise ValueError(f"Person {linked_from_id} links to {person_id} who is not in the CSV file")
+    return people_by_id[person_id]
+
+def save_family_tree_to_csv(family_tree: FamilyTree, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+        Save a family tree to a CSV file which can be loaded with load_family_tree_from_csv
+        Each person's id is their reference in the family tree
+        Only each person's current spouse is saved, previous partners added with add_partners are not
+        :param family_tree: the family tree to save
+        :param path: the path of the CSV file
+        :param chunk_size: the number of rows to write at a time
+    """
+    save_people_to_csv(family_tree, family_tree.people, path, chunk_size)
+
+def save_branches_to_csv(family_tree: FamilyTree, directory: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+        Save each branch of a family tree to its own CSV file, and an index of everyone's name and branch
+        Each branch file can be loaded on its own with load_family_tree_from_csv, or through BranchStore
+        :param family_tree: the family tree to save
+        :param directory: the directory to save the files in, it must already exist
+        :param chunk_size: the number of rows to write at a time
+    """
+    with open(os.path.join(directory, BRANCH_INDEX_FILE_NAME), "w", newline="", encoding="utf-8") as index_file:
+        writer = csv.writer(index_file)
+        writer.writerow(BRANCH_INDEX_COLUMNS)
+
+        for component_id in family_tree.components.get_component_ids():
+            people: List[Person] = [family_tree.people[reference] for reference in family_tree.components.get_members(component_id)]
+            save_people_to_csv(family_tree, people, os.path.join(directory, BRANCH_FILE_NAME.format(component_id)), chunk_size)
+            writer.writerows((component_id, row, person.first_name, person.last_name) for row, person in enumerate(people))
+
+def save_people_to_csv(family_tree: FamilyTree, people: List[Person], path: str, chunk_size: int) -> None:
+    """
+        Save some of the people in a family tree to a CSV file, everyone they link to must be saved in the same file
+        Each person's id is their reference in the family tree
+        :param family_tree: the family tree the people are in
+        :param people: the people to save
+        :param path: the path of the CSV file
+        :param chunk_size: the number of rows to write at a time
+    """
+    references: Dict[Person, int] = family_tree.references
+
+    def get_id(person: Optional[Person]) -> str:
+        """
+            Get the id a person is saved with
+            :param person: the person
+            :return: their id or an empty string if they are unknown
+        """
+        return str(references[person]) if person is not None else ""
+
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(COLUMNS)
+
+        for start in range(0, len(people), chunk_size):
+            writer.writerows(
+                (
+                    references[person],
+                    person.first_name,
+                    person.last_name,
+                    person.sex.value,
+                    person.date_of_birth.isoformat(),
+                    person.date_of_death.isoformat() if person.date_of_death is not None else "",
+                    get_id(person.mother),
+                    get_id(person.father),
+                    get_id(person.spouse),
+                )
+                for person in people[start:start + chunk_size]
+            )
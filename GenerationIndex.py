@@ -0,0 +1,100 @@
+# This class contains the generation index used by FamilyTree
+# Founders (people with no known parents) are generation 0 and their children generation 1 and so on
+# Someone whose parents are from different generations has a different min and max generation,
+# people are grouped by their max generation so they are always listed below both of their parents
+# Generations are calculated as people are added, parents are always added before their children,
+# and when someone's parents change only their descendants are recalculated, in generation order
+# When many people's parents are set at once everyone is recalculated in a single pass, parents first
+
+import heapq
+from typing import Dict, List, Set, Tuple
+from Person import Person
+
+class GenerationIndex:
+    """GenerationIndex class stores the generation of each person and everyone in each generation"""
+    def __init__(self):
+        """
+            Create an empty generation index
+        """
+        # The (min, max) generation of each person
+        self.generations: Dict[Person, Tuple[int, int]] = {}
+        # The people in each max generation, a dict is used as an ordered set
+        self.people: Dict[int, Dict[Person, None]] = {}
+
+    def calculate_generation(self, person: Person) -> Tuple[int, int]:
+        """
+            Calculate a person's generation from their parents' generations
+            :param person: the person, their parents must already be in the index
+            :return: their (min, max) generation
+        """
+        parent_generations: List[Tuple[int, int]] = [self.generations[parent] for parent in (person.mother, person.father) if parent is not None]
+        if len(parent_generations) == 0:
+            return 0, 0
+        return min(generation[0] for generation in parent_generations) + 1, max(generation[1] for generation in parent_generations) + 1
+
+    def set_generation(self, person: Person, generation: Tuple[int, int]) -> None:
+        """
+            Set a person's generation and move them to the right group
+            :param person: the person
+            :param generation: their (min, max) generation
+        """
+        if person in self.generations:
+            old_group: Dict[Person, None] = self.people[self.generations[person][1]]
+            del old_group[person]
+        self.generations[person] = generation
+        self.people.setdefault(generation[1], {})[person] = None
+
+    def add(self, person: Person) -> None:
+        """
+            Add a person to the index
+            :param person: the person, their parents must already be in the index
+        """
+        self.set_generation(person, self.calculate_generation(person))
+
+    def update(self, person: Person, children: Dict[Person, List[Person]]) -> None:
+        """
+            Recalculate the generation of a person after their parents change, and of any descendants it changes
+            Descendants are recalculated in order of their old max generation, which puts everyone after their parents,
+            so each person is recalculated at most once
+            :param person: the person
+            :param children: each person's children
+        """
+        # The order each person was queued in breaks ties, so people are never compared
+        pending: List[Tuple[int, int, Person]] = [(self.generations[person][1], 0, person)]
+        queued: Set[Person] = {person}
+        while pending:
+            descendant: Person = heapq.heappop(pending)[2]
+            generation: Tuple[int, int] = self.calculate_generation(descendant)
+            if generation == self.generations[descendant]:
+                continue
+            for child in children[descendant]:
+                if child not in queued:
+                    queued.add(child)
+                    heapq.heappush(pending, (self.generations[child][1], len(queued), child))
+            self.set_generation(descendant, generation)
+
+    def build(self, order: List[Person]) -> None:
+        """
+            Recalculate everyone's generation in one pass, e.g. after many people's parents have been set at once
+            :param order: everyone in the index, parents before their children
+        """
+        for person in order:
+            generation: Tuple[int, int] = self.calculate_generation(person)
+            if generation != self.generations[person]:
+                self.set_generation(person, generation)
+
+    def get_generation(self, person: Person) -> Tuple[int, int]:
+        """
+            Get a person's generation
+            :param person: the person
+            :return: their (min, max) generation
+        """
+        return self.generations[person]
+
+    def get_people_in_generation(self, generation: int) -> List[Person]:
+        """
+            Get everyone whose max generation is the given generation
+            :param generation: the generation, 0 for founders
+            :return: the people in the generation, in the order they were added to it
+        """
+        return list(self.people.get(generation, {}))
@@ -0,0 +1,174 @@
+# This class contains the lifespan index used by FamilyTree
+# It stores each person's (birth, death) lifespan in a centered interval tree
+# so the people alive on a date can be found without checking everyone
+# The interval tree is rebuilt lazily, the first query after a person is added or marked deceased rebuilds it
+# in O(N log N) time by sorting the lifespans once, both queries read the lifespans as they were at the last rebuild
+# so people must be marked deceased through FamilyTree.set_deceased for the index to see it
+
+import datetime
+import heapq
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from Person import Person
+
+# The end of the lifespan of someone who is still alive
+STILL_ALIVE: int = datetime.date.max.toordinal()
+
+class LifespanNode:
+    """LifespanNode class is a node of the interval tree holding the lifespans which contain its center"""
+    def __init__(self, center: int, by_birth: List[Tuple[int, int, Person]], by_death: List[Tuple[int, int, Person]]):
+        """
+            Create a node from the lifespans containing the center
+            :param center: the ordinal day the node is centered on
+            :param by_birth: the (birth ordinal, death ordinal, person) lifespans containing the center, earliest birth first
+            :param by_death: the same lifespans, latest death first
+        """
+        self.center: int = center
+        self.by_birth: List[Tuple[int, int, Person]] = by_birth
+        self.by_death: List[Tuple[int, int, Person]] = by_death
+        self.left: Optional[LifespanNode] = None
+        self.right: Optional[LifespanNode] = None
+
+class LifespanIndex:
+    """LifespanIndex class answers which people were alive on a date and how many were alive each year"""
+    def __init__(self):
+        """
+            Create an empty lifespan index
+        """
+        self.people: List[Person] = []
+        self.root: Optional[LifespanNode] = None
+        # The (birth year, death year) of everyone at the last rebuild, MAXYEAR if they were alive
+        self.years: List[Tuple[int, int]] = []
+        self.up_to_date: bool = True
+
+    def add(self, person: Person) -> None:
+        """
+            Add a person to the index
+            :param person: the person to add
+        """
+        self.people.append(person)
+        self.up_to_date = False
+
+    def update(self) -> None:
+        """
+            Mark the index as out of date, e.g. after someone has been marked deceased
+        """
+        self.up_to_date = False
+
+    @staticmethod
+    def get_lifespan(person: Person) -> Tuple[int, int, Person]:
+        """
+            Get the lifespan of a person as ordinal days
+            :param person: the person
+            :return: the birth ordinal, death ordinal (STILL_ALIVE if they are alive) and the person
+        """
+        death: int = person.date_of_death.toordinal() if person.date_of_death is not None else STILL_ALIVE
+        return person.date_of_birth.toordinal(), death, person
+
+    def build(self) -> None:
+        """
+            Rebuild the interval tree and the lifespan years from everyone in the index, this takes O(N log N) time
+        """
+        # The lifespans are sorted once here, splitting a sorted list keeps both halves sorted
+        lifespans: List[Tuple[int, int, Person]] = [LifespanIndex.get_lifespan(person) for person in self.people]
+        by_birth: List[Tuple[int, int, Person]] = sorted(lifespans, key=lambda lifespan: lifespan[0])
+        by_death: List[Tuple[int, int, Person]] = sorted(lifespans, key=lambda lifespan: lifespan[1], reverse=True)
+        self.root = LifespanIndex.build_node(by_birth, by_death)
+        self.years = [
+            (person.date_of_birth.year, person.date_of_death.year if person.date_of_death is not None else datetime.MAXYEAR)
+            for person in self.people
+        ]
+        self.up_to_date = True
+
+    @staticmethod
+    def build_node(by_birth: List[Tuple[int, int, Person]], by_death: List[Tuple[int, int, Person]]) -> Optional[LifespanNode]:
+        """
+            Build an interval tree node centered on the median endpoint of the lifespans, in time linear in the number of lifespans
+            :param by_birth: the lifespans to put under the node, earliest birth first
+            :param by_death: the same lifespans, latest death first
+            :return: the node or None if there are no lifespans
+        """
+        if len(by_birth) == 0:
+            return None
+
+        # Merging the sorted births and deaths gives the sorted endpoints without sorting them again
+        endpoints: Iterator[int] = heapq.merge((lifespan[0] for lifespan in by_birth), (lifespan[1] for lifespan in reversed(by_death)))
+        center: int = next(islice(endpoints, len(by_birth), None))
+
+        # Split the lifespans into ending before the center, containing it, and starting after it, keeping each list sorted
+        node: LifespanNode = LifespanNode(
+            center,
+            [lifespan for lifespan in by_birth if lifespan[0] <= center <= lifespan[1]],
+            [lifespan for lifespan in by_death if lifespan[0] <= center <= lifespan[1]],
+        )
+        node.left = LifespanIndex.build_node(
+            [lifespan for lifespan in by_birth if lifespan[1] < center],
+            [lifespan for lifespan in by_death if lifespan[1] < center],
+        )
+        node.right = LifespanIndex.build_node(
+            [lifespan for lifespan in by_birth if lifespan[0] > center],
+            [lifespan for lifespan in by_death if lifespan[0] > center],
+        )
+        return node
+
+    def alive_on(self, date: datetime.date) -> List[Person]:
+        """
+            Get everyone alive on a date, this takes O(log N + k) time for k people once the index is up to date
+            :param date: the date, people who were born or died on the date count as alive
+            :return: the people alive on the date
+        """
+        if not self.up_to_date:
+            self.build()
+
+        day: int = date.toordinal()
+        alive: List[Person] = []
+        node: Optional[LifespanNode] = self.root
+        while node is not None:
+            if day < node.center:
+                # Everyone in the node is alive on the center, so only the birth needs checking
+                for birth, _, person in node.by_birth:
+                    if birth > day:
+                        break
+                    alive.append(person)
+                node = node.left
+            elif day > node.center:
+                # Only the death needs checking
+                for _, death, person in node.by_death:
+                    if death < day:
+                        break
+                    alive.append(person)
+                node = node.right
+            else:
+                alive.extend(person for _, _, person in node.by_birth)
+                break
+
+        return alive
+
+    def population_by_year(self, start_year: int, end_year: int) -> Dict[int, int]:
+        """
+            Count how many people were alive at some point in each year, in a single pass over everyone
+            The counts use the same lifespans as alive_on, rebuilding the index first if it is out of date
+            :param start_year: the first year to count
+            :param end_year: the last year to count
+            :return: the year mapped to the number of people alive during it
+        """
+        if not self.up_to_date:
+            self.build()
+
+        # Record +1 in the first counted year of each lifespan and -1 in the year after the last one
+        changes: List[int] = [0] * (end_year - start_year + 2)
+        for birth_year, death_year in self.years:
+            first_year: int = max(birth_year, start_year)
+            last_year: int = min(death_year, end_year)
+            if first_year <= last_year:
+                changes[first_year - start_year] += 1
+                changes[last_year - start_year + 1] -= 1
+
+        # A running total of the changes gives the population of each year
+        population: Dict[int, int] = {}
+        alive: int = 0
+        for year in range(start_year, end_year + 1):
+            alive += changes[year - start_year]
+            population[year] = alive
+
+        return population
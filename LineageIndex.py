@@ -0,0 +1,52 @@
+# This class contains the surname and direct line index used by FamilyTree
+# Surnames are interned and mapped to everyone with that surname
+# Direct lines (father's father's father... or mother's mother's mother...) are not cached,
+# each person's mother and father already form a chain of parent pointers, so a line is built by following it
+# This takes O(length of the line) time, uses no memory between calls and never goes stale when parents change
+
+import sys
+from typing import Dict, List, Optional
+from Person import Person
+
+# The parent followed by each direct line
+LINES: Dict[str, str] = {"patrilineal": "father", "matrilineal": "mother"}
+
+class LineageIndex:
+    """LineageIndex class maps surnames to people and finds direct lines of descent"""
+    def __init__(self):
+        """
+            Create an empty lineage index
+        """
+        self.surnames: Dict[str, List[Person]] = {}
+
+    def add(self, person: Person) -> None:
+        """
+            Add a person to the surname index
+            :param person: the person to add
+        """
+        # Everyone with the same surname shares one string
+        person.last_name = sys.intern(person.last_name)
+        self.surnames.setdefault(person.last_name, []).append(person)
+
+    def get_people_with_surname(self, surname: str) -> List[Person]:
+        """
+            Get everyone with a surname
+            :param surname: the surname
+            :return: the people with the surname, in the order they were added
+        """
+        return list(self.surnames.get(surname, []))
+
+    def get_line(self, person: Person, line: str) -> List[Person]:
+        """
+            Get the direct line of a person by following their parent pointers
+            :param person: the person
+            :param line: patrilineal or matrilineal
+            :return: the person followed by their father, father's father, etc. (or mothers for matrilineal)
+        """
+        parent_attribute: str = LINES[line]
+        people: List[Person] = []
+        ancestor: Optional[Person] = person
+        while ancestor is not None:
+            people.append(ancestor)
+            ancestor = getattr(ancestor, parent_attribute)
+        return people
@@ -0,0 +1,200 @@
+# This class contains the relationship query language
+# A query is a path of relationship steps joined with dots, e.g. parents.siblings.children
+# Paths can be combined with + (union), - (difference) and & (intersection), e.g. parents.siblings.children - self
+# Every path starts from the person the query is run for
+# A query is parsed once into a plan, each step of the plan maps a whole set of person references to the next set
+
+from functools import lru_cache
+import re
+from typing import Callable, Dict, List, Set, Tuple, TYPE_CHECKING
+from Person import Person
+
+# FamilyTree imports this file, so it is only imported for type checking
+if TYPE_CHECKING:
+    from FamilyTree import FamilyTree
+
+# Matches a step name, an operator or anything else (which is invalid), skipping whitespace
+TOKEN_PATTERN: re.Pattern = re.compile(r"\s*(?:([A-Za-z_]+)|(.))")
+
+class RelationshipQuery:
+    """RelationshipQuery class is a parsed relationship query which can be run against a family tree"""
+    def __init__(self, expression: str):
+        """
+            Parse a query into a plan
+            :param expression: the query e.g. parents.siblings.children - self
+            :raises ValueError: if the query is not valid
+        """
+        self.expression: str = expression
+        # Each term of the plan is the operator joining it to the terms before it and its steps
+        self.plan: List[Tuple[str, Tuple[str, ...]]] = RelationshipQuery.parse(expression)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile(expression: str) -> "RelationshipQuery":
+        """
+            Get the parsed query for an expression, each expression is only parsed once
+            :param expression: the query
+            :return: the parsed query
+        """
+        return RelationshipQuery(expression)
+
+    @staticmethod
+    def parse(expression: str) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+            Parse a query into its terms
+            :param expression: the query
+            :return: the plan, a list of (operator, steps) terms, the first operator is always +
+            :raises ValueError: if the query is not valid
+        """
+        tokens: List[str] = [name or symbol for name, symbol in TOKEN_PATTERN.findall(expression.strip())]
+        plan: List[Tuple[str, Tuple[str, ...]]] = []
+        operator: str = "+"
+        steps: List[str] = []
+        expecting_step: bool = True
+
+        for token in tokens:
+            if expecting_step:
+                if token not in STEPS:
+                    raise ValueError(f"Unknown relationship \"{token}\", expected one of: {', '.join(STEPS)}")
+                steps.append(token)
+                expecting_step = False
+            elif token == ".":
+                expecting_step = True
+            elif token in OPERATORS:
+                plan.append((operator, tuple(steps)))
+                operator = token
+                steps = []
+                expecting_step = True
+            else:
+                raise ValueError(f"Unexpected \"{token}\", expected \".\" or one of: {' '.join(OPERATORS)}")
+
+        if expecting_step:
+            raise ValueError("Incomplete query, expected a relationship")
+        plan.append((operator, tuple(steps)))
+
+        return plan
+
+    def run(self, family_tree: "FamilyTree", person: Person) -> List[Person]:
+        """
+            Run the query for a person
+            :param family_tree: the family tree the person is in
+            :param person: the person the query starts from
+            :return: the people matching the query, in the order they were added to the family tree
+        """
+        start: Set[int] = {family_tree.get_reference_from_person(person)}
+        result: Set[int] = set()
+
+        for operator, steps in self.plan:
+            # Each step works on the whole set at once, the set removes duplicates between steps
+            references: Set[int] = start
+            for step in steps:
+                references = STEPS[step](family_tree, references)
+            result = OPERATORS[operator](result, references)
+
+        return [family_tree.people[reference] for reference in sorted(result)]
+
+    @staticmethod
+    def get_self(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the same people
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the same references
+        """
+        return references
+
+    @staticmethod
+    def get_mothers(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the known mothers
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their mothers
+        """
+        people: List[Person] = family_tree.people
+        return {family_tree.references[people[reference].mother] for reference in references if people[reference].mother is not None}
+
+    @staticmethod
+    def get_fathers(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the known fathers
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their fathers
+        """
+        people: List[Person] = family_tree.people
+        return {family_tree.references[people[reference].father] for reference in references if people[reference].father is not None}
+
+    @staticmethod
+    def get_parents(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the known parents
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their parents
+        """
+        return RelationshipQuery.get_mothers(family_tree, references) | RelationshipQuery.get_fathers(family_tree, references)
+
+    @staticmethod
+    def get_children(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the children
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their children
+        """
+        people: List[Person] = family_tree.people
+        return {family_tree.references[child] for reference in references for child in family_tree.children[people[reference]]}
+
+    @staticmethod
+    def get_siblings(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the full and half siblings
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their siblings, not including themselves
+        """
+        siblings: Set[int] = RelationshipQuery.get_children(family_tree, RelationshipQuery.get_parents(family_tree, references))
+
+        # Someone in the current references is only kept if they share a parent with another of them
+        people: List[Person] = family_tree.people
+        children_in_references: Dict[Person, int] = {}
+        for reference in references:
+            for parent in (people[reference].mother, people[reference].father):
+                if parent is not None:
+                    children_in_references[parent] = children_in_references.get(parent, 0) + 1
+        for reference in references:
+            person: Person = people[reference]
+            if all(children_in_references.get(parent, 0) < 2 for parent in (person.mother, person.father) if parent is not None):
+                siblings.discard(reference)
+
+        return siblings
+
+    @staticmethod
+    def get_spouses(family_tree: "FamilyTree", references: Set[int]) -> Set[int]:
+        """
+            Step to the spouses, including previous spouses
+            :param family_tree: the family tree
+            :param references: the current references
+            :return: the references of their spouses
+        """
+        people: List[Person] = family_tree.people
+        return {family_tree.references[partner] for reference in references for partner in family_tree.get_partners(people[reference])}
+
+# The steps which can be used in a query
+STEPS: Dict[str, Callable[..., Set[int]]] = {
+    "self": RelationshipQuery.get_self,
+    "mother": RelationshipQuery.get_mothers,
+    "father": RelationshipQuery.get_fathers,
+    "parents": RelationshipQuery.get_parents,
+    "children": RelationshipQuery.get_children,
+    "siblings": RelationshipQuery.get_siblings,
+    "spouse": RelationshipQuery.get_spouses,
+}
+
+# The operators which combine paths
+OPERATORS: Dict[str, Callable[[Set[int], Set[int]], Set[int]]] = {
+    "+": lambda result, references: result | references,
+    "-": lambda result, references: result - references,
+    "&": lambda result, references: result & references,
+}
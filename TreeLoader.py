@@ -0,0 +1,86 @@
+# This class loads the family tree on a background thread so the console menu can start straight away
+# Loading happens in stages, the people stage is reached once everyone and their names have been added
+# and the relationships stage once parents and spouses have been linked
+# Calling code waits only for the stage it needs, e.g. listing names only needs the people stage
+# A loader function is given a callback to report each stage as it is reached,
+# any stages it does not report are reached when it finishes
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+
+# The family tree modules are imported by the loader on the background thread
+if TYPE_CHECKING:
+    from FamilyTree import FamilyTree
+
+# The loading stages, in order
+STAGES: List[str] = ["people", "relationships"]
+
+class TreeLoader:
+    """TreeLoader class loads a family tree on a background thread in stages"""
+    def __init__(self, load: Callable[[Callable[[str, "FamilyTree"], None]], "FamilyTree"]):
+        """
+            Create a loader, call start to begin loading
+            :param load: the loader function, it is called with a callback taking the stage reached and the family tree
+        """
+        self.load: Callable[[Callable[[str, "FamilyTree"], None]], "FamilyTree"] = load
+        self.family_tree: Optional["FamilyTree"] = None
+        self.error: Optional[BaseException] = None
+        self.stages: Dict[str, threading.Event] = {stage: threading.Event() for stage in STAGES}
+        # Seconds from starting to each stage being reached
+        self.timings: Dict[str, float] = {}
+        self.start_time: float = 0.0
+        self.thread: threading.Thread = threading.Thread(target=self.run, name="TreeLoader", daemon=True)
+
+    def start(self) -> None:
+        """
+            Start loading on the background thread
+        """
+        self.start_time = time.perf_counter()
+        self.thread.start()
+
+    def run(self) -> None:
+        """
+            Run the loader function, this is run on the background thread
+        """
+        try:
+            family_tree: "FamilyTree" = self.load(self.report_stage)
+            for stage in STAGES:
+                self.report_stage(stage, family_tree)
+        # Keep the error to raise it on the thread waiting for the tree
+        except BaseException as error:
+            self.error = error
+            for event in self.stages.values():
+                event.set()
+
+    def report_stage(self, stage: str, family_tree: "FamilyTree") -> None:
+        """
+            Mark a stage, and every stage before it, as reached
+            :param stage: the stage reached
+            :param family_tree: the family tree being loaded
+        """
+        self.family_tree = family_tree
+        for reached_stage in STAGES[:STAGES.index(stage) + 1]:
+            if not self.stages[reached_stage].is_set():
+                self.timings[reached_stage] = time.perf_counter() - self.start_time
+                self.stages[reached_stage].set()
+
+    def is_ready(self, stage: str) -> bool:
+        """
+            Check if a stage has been reached without waiting
+            :param stage: the stage
+            :return: if the stage has been reached
+        """
+        return self.stages[stage].is_set()
+
+    def wait_for(self, stage: str) -> "FamilyTree":
+        """
+            Wait until a stage has been reached
+            :param stage: the stage to wait for
+            :return: the family tree, only the data for the stage waited for is guaranteed to be loaded
+            :raises BaseException: the error raised by the loader function if it failed
+        """
+        self.stages[stage].wait()
+        if self.error is not None:
+            raise self.error
+        return self.family_tree
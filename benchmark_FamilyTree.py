@@ -0,0 +1,93 @@
+#!/usr/bin/python
+
+# This file contains a scaling benchmark for building and loading the family tree
+# It creates family trees of increasing size with a fixed number of generations and times
+# adding everyone with add_person, building a branch and loading CSV files with parents first and children first
+# Every time should roughly double when the number of people doubles
+# Usage: python benchmark_FamilyTree.py [smallest number of people] [number of generations]
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional
+from FamilyTree import FamilyTree
+from FamilyTreeCSV import COLUMNS, load_family_tree_from_csv
+from Person import Person
+from SimplifiedSex import SimplifiedSex
+
+def create_generations(number_of_people: int, number_of_generations: int) -> List[Person]:
+    """
+        Create people in generations, everyone after the first generation has two parents from the generation before
+        :param number_of_people: the number of people to create
+        :param number_of_generations: the number of generations
+        :return: the people, parents before their children
+    """
+    random.seed(0)
+    people: List[Person] = []
+    generation_size: int = number_of_people // number_of_generations
+    previous_mothers: List[Person] = []
+    previous_fathers: List[Person] = []
+    for generation in range(number_of_generations):
+        mothers: List[Person] = []
+        fathers: List[Person] = []
+        for i in range(generation_size):
+            sex: SimplifiedSex = SimplifiedSex.FEMALE if i % 2 == 0 else SimplifiedSex.MALE
+            mother: Optional[Person] = random.choice(previous_mothers) if previous_mothers else None
+            father: Optional[Person] = random.choice(previous_fathers) if previous_fathers else None
+            person: Person = Person(f"Person{len(people)}", f"Surname{i % 100}", sex, datetime.date(1000 + generation * 25, 1, 1), mother, father)
+            people.append(person)
+            (mothers if sex is SimplifiedSex.FEMALE else fathers).append(person)
+        previous_mothers, previous_fathers = mothers, fathers
+    return people
+
+def write_csv(people: List[Person], path: str, children_first: bool) -> None:
+    """
+        Write people to a CSV file in parents first or children first order
+        :param people: the people, parents before their children
+        :param path: the path of the CSV file
+        :param children_first: if the rows should be in reverse order
+    """
+    ids = {person: str(reference) for reference, person in enumerate(people)}
+    with open(path, "w", encoding="utf-8") as csv_file:
+        csv_file.write(",".join(COLUMNS) + "\n")
+        for person in (reversed(people) if children_first else people):
+            mother_id: str = ids[person.mother] if person.mother is not None else ""
+            father_id: str = ids[person.father] if person.father is not None else ""
+            csv_file.write(f"{ids[person]},{person.first_name},{person.last_name},{person.sex.value},{person.date_of_birth.isoformat()},,{mother_id},{father_id},\n")
+
+def time_it(function: Callable[[], object]) -> float:
+    """
+        Time a function
+        :param function: the function to time
+        :return: the time taken in seconds
+    """
+    start: float = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def run_benchmark(smallest_number_of_people: int, number_of_generations: int) -> None:
+    """
+        Time building and loading family trees of 1, 2 and 4 times the smallest number of people
+        :param smallest_number_of_people: the number of people in the smallest family tree
+        :param number_of_generations: the number of generations in each family tree
+    """
+    print(f"{'people':>8} {'add_person':>11} {'get_branch':>11} {'csv parents':>12} {'csv children':>13}")
+    for multiple in (1, 2, 4):
+        people: List[Person] = create_generations(smallest_number_of_people * multiple, number_of_generations)
+        family_tree: FamilyTree = FamilyTree()
+        add_time: float = time_it(lambda: [family_tree.add_person(person) for person in people])
+        family_tree.get_descendant_counts(people[0])
+        branch_time: float = time_it(lambda: family_tree.get_branch(people[-1]))
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "family_tree.csv")
+            write_csv(people, path, False)
+            parents_first_time: float = time_it(lambda: load_family_tree_from_csv(path))
+            write_csv(people, path, True)
+            children_first_time: float = time_it(lambda: load_family_tree_from_csv(path))
+        print(f"{len(people):>8} {add_time:>10.2f}s {branch_time:>10.2f}s {parents_first_time:>11.2f}s {children_first_time:>12.2f}s")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000, int(sys.argv[2]) if len(sys.argv) > 2 else 20)
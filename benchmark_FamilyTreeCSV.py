@@ -0,0 +1,65 @@
+#!/usr/bin/python
+
+# This file contains a throughput benchmark for loading and saving the family tree as CSV
+# It creates a synthetic family tree, saves it, loads it back and prints the rows per second of each
+# Usage: python benchmark_FamilyTreeCSV.py [number of people] [chunk size]
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+from FamilyTree import FamilyTree
+from FamilyTreeCSV import DEFAULT_CHUNK_SIZE, load_family_tree_from_csv, save_family_tree_to_csv
+from Person import Person
+from SimplifiedSex import SimplifiedSex
+
+def create_synthetic_family_tree(number_of_people: int) -> FamilyTree:
+    """
+        Create a family tree of random couples and their children
+        :param number_of_people: the number of people to create
+        :return: the family tree
+    """
+    random.seed(0)
+    family_tree: FamilyTree = FamilyTree()
+    couples = []
+    while len(family_tree.people) < number_of_people:
+        # Either start a new couple or give an existing couple a child
+        if len(couples) < 2 or random.random() < 0.3:
+            mother = family_tree.add_person(Person(f"Mother{len(family_tree.people)}", "Synthetic", SimplifiedSex.FEMALE, datetime.date(1900, 1, 1) + datetime.timedelta(days=random.randint(0, 30000))))
+            father = family_tree.add_person(Person(f"Father{len(family_tree.people)}", "Synthetic", SimplifiedSex.MALE, mother.date_of_birth))
+            family_tree.set_partner(mother, father)
+            couples.append((mother, father))
+        else:
+            mother, father = random.choice(couples)
+            child = family_tree.add_person(Person(f"Child{len(family_tree.people)}", "Synthetic", random.choice(list(SimplifiedSex)), mother.date_of_birth + datetime.timedelta(days=9000), mother, father))
+            if random.random() < 0.2:
+                family_tree.set_deceased(child, child.date_of_birth + datetime.timedelta(days=25000))
+    return family_tree
+
+def run_benchmark(number_of_people: int, chunk_size: int) -> None:
+    """
+        Time saving and loading a synthetic family tree and print the throughput
+        :param number_of_people: the number of people in the family tree
+        :param chunk_size: the number of rows read or written at a time
+    """
+    family_tree: FamilyTree = create_synthetic_family_tree(number_of_people)
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "family_tree.csv")
+        
+        start: float = time.perf_counter()
+        save_family_tree_to_csv(family_tree, path, chunk_size)
+        save_time: float = time.perf_counter() - start
+        size: int = os.path.getsize(path)
+        
+        start = time.perf_counter()
+        loaded: FamilyTree = load_family_tree_from_csv(path, chunk_size)
+        load_time: float = time.perf_counter() - start
+        
+    print(f"{len(loaded.people)} people, {size / 1e6:.1f} MB, chunk size {chunk_size}")
+    print(f"Save: {save_time:.3f} s, {len(family_tree.people) / save_time:,.0f} rows/s, {size / 1e6 / save_time:.1f} MB/s")
+    print(f"Load: {load_time:.3f} s, {len(loaded.people) / load_time:,.0f} rows/s, {size / 1e6 / load_time:.1f} MB/s")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CHUNK_SIZE)
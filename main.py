@@ -4,15 +4,16 @@
 # It should not contain any code except that responsible
 # for creating the console menu and entering the loop
 
+import sys
 from ConsoleMenu import ConsoleMenu
 
 def console_interface_entry() -> None:
     """
-        Create and enter CLI loop
+        Create and enter CLI loop, an optional CSV file to load the family tree from can be given as the first argument
     """
     
     # Create the console menu and enter menu loop 
-    console_menu: ConsoleMenu = ConsoleMenu()
+    console_menu: ConsoleMenu = ConsoleMenu(sys.argv[1] if len(sys.argv) > 1 else None)
     console_menu.enter_loop()
 
 if __name__ == '__main__':
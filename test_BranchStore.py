@@ -0,0 +1,72 @@
+#!/usr/bin/python
+
+# This class contains tests for loading the branches of the family tree one at a time
+# Using the the unittest library in Python
+# Saves the default family tree scenario defined in CreateTree.py as branches and loads them back
+
+if __name__ == "__main__":
+    print("Please run me via \"unittest\". See readme for details.")
+
+
+import datetime
+import tempfile
+from typing import List, Tuple
+import unittest
+
+from BranchStore import BranchStore
+from CreateTree import create_populated_family_tree
+from FamilyTree import FamilyTree
+from FamilyTreeCSV import save_branches_to_csv
+from Person import Person
+from SimplifiedSex import SimplifiedSex
+
+class BranchStoreTesting(unittest.TestCase):
+    # Unit test setup
+    def setUp(self):
+        self.family_tree: FamilyTree = create_populated_family_tree()
+        # Add an unrelated couple so there are two branches
+        sam: Person = self.family_tree.add_person(Person("Sam", "Stranger", SimplifiedSex.MALE, datetime.date(1990, 1, 1)))
+        alex: Person = self.family_tree.add_person(Person("Alex", "Stranger", SimplifiedSex.FEMALE, datetime.date(1991, 1, 1)))
+        self.family_tree.set_partner(sam, alex)
+        self.directory = tempfile.TemporaryDirectory()
+        save_branches_to_csv(self.family_tree, self.directory.name, 4)
+        self.branch_store: BranchStore = BranchStore(self.directory.name, 1)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_branches(self):
+        # Test every branch is saved with the same people as the branch in memory
+        self.assertEqual(len(self.branch_store.get_branch_ids()), 2)
+        self.assertEqual(self.branch_store.get_branch_ids(), self.family_tree.components.get_component_ids())
+        for branch_id in self.branch_store.get_branch_ids():
+            members: List[int] = self.family_tree.components.get_members(branch_id)
+            branch: FamilyTree = self.branch_store.get_branch(branch_id)
+            self.assertEqual([str(person) for person in branch.people], [str(self.family_tree.people[reference]) for reference in members])
+    
+    def test_find_people(self):
+        # Test finding someone loads only their branch, with their relatives linked
+        found: List[Tuple[FamilyTree, Person]] = self.branch_store.find_people("Otto", "Emmersohn")
+        self.assertEqual(len(found), 1)
+        branch, person = found[0]
+        self.assertEqual(list(self.branch_store.loaded.values()), [branch])
+        original: Person = self.family_tree.people[23]
+        self.assertEqual(len(branch.people), len(self.family_tree.get_branch(original).people))
+        self.assertEqual(str(person.mother), str(original.mother))
+        self.assertEqual(str(person.father), str(original.father))
+        self.assertEqual(self.branch_store.find_people("No", "One"), [])
+    
+    def test_least_recently_used(self):
+        # Test only the most recently used branch is kept in memory
+        first_id, second_id = self.branch_store.get_branch_ids()
+        first: FamilyTree = self.branch_store.get_branch(first_id)
+        self.assertIs(self.branch_store.get_branch(first_id), first)
+        second: FamilyTree = self.branch_store.get_branch(second_id)
+        self.assertEqual(list(self.branch_store.loaded.keys()), [second_id])
+        
+        # Test the evicted branch is loaded again on the next access
+        reloaded: FamilyTree = self.branch_store.get_branch(first_id)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual([str(person) for person in reloaded.people], [str(person) for person in first.people])
+        self.assertEqual(list(self.branch_store.loaded.keys()), [first_id])
+        self.assertEqual([str(person) for person in second.people], ["Sam Stranger", "Alex Stranger"])
@@ -9,12 +9,14 @@ if __name__ == "__main__":
     print("Please run me via \"unittest\". See readme for details.")
 
 
-from typing import List, Optional, Tuple
+import datetime
+from typing import Dict, List, Optional, Tuple
 import unittest
 
 from CreateTree import create_populated_family_tree
 from FamilyTree import FamilyTree
 from Person import Person
+from SimplifiedSex import SimplifiedSex
 
 class FamilyTreeTesting(unittest.TestCase):
     # Unit test setup
@@ -101,4 +103,236 @@ class FamilyTreeTesting(unittest.TestCase):
     
     def test_get_birthdays(self):
         # Test number of birthdays
-        self.assertEqual(len(self.family_tree.get_birthdays()), 25)
\ No newline at end of file
+        self.assertEqual(len(self.family_tree.get_birthdays()), 25)
+    
+    def test_get_component_id(self):
+        # Test Adam Elderson-Copper and Ethan Eyre are linked through marriages
+        self.assertEqual(self.family_tree.get_component_id(self.family_tree.get_person_from_reference(0)), self.family_tree.get_component_id(self.family_tree.get_person_from_reference(24)))
+        
+        # Test an unrelated person is in their own component
+        stranger: Person = self.family_tree.add_person(Person("Sam", "Stranger", SimplifiedSex.MALE, datetime.date(1990, 1, 1)))
+        self.assertNotEqual(self.family_tree.get_component_id(stranger), self.family_tree.get_component_id(self.family_tree.get_person_from_reference(0)))
+    
+    def test_get_branches(self):
+        # Test the sample tree is a single branch
+        self.assertEqual(len(self.family_tree.get_branches()), 1)
+        
+        # Test an unrelated couple is split into a second branch
+        sam: Person = self.family_tree.add_person(Person("Sam", "Stranger", SimplifiedSex.MALE, datetime.date(1990, 1, 1)))
+        alex: Person = self.family_tree.add_person(Person("Alex", "Stranger", SimplifiedSex.FEMALE, datetime.date(1991, 1, 1)))
+        self.family_tree.set_partner(sam, alex)
+        branches: List[FamilyTree] = self.family_tree.get_branches()
+        self.assertEqual(sorted(len(branch.people) for branch in branches), [2, 25])
+        
+        # Test lookups work inside a branch
+        branch: FamilyTree = self.family_tree.get_branch(self.family_tree.get_person_from_reference(9))
+        self.assertEqual(len(branch.get_children(self.family_tree.get_person_from_reference(9))), 1)
+        
+        # Test removing someone's parents splits them into their own branch
+        lee: Person = self.family_tree.get_person_from_reference(21)
+        self.family_tree.set_parents(lee, None, None)
+        branch = self.family_tree.get_branch(self.family_tree.get_person_from_reference(9))
+        self.assertEqual(len(branch.get_children(self.family_tree.get_person_from_reference(9))), 0)
+        self.assertNotIn(lee, branch.people)
+        self.assertEqual([str(person) for person in self.family_tree.get_branch(lee).people], ["Lee Elderson-Copper"])
+        
+        # Test Bexton Elderson-Copper's family was only linked to the rest through Lee
+        self.assertEqual(sorted(len(branch.people) for branch in self.family_tree.get_branches()), [1, 2, 4, 20])
+        self.assertIsNone(self.family_tree.find_path(lee, self.family_tree.get_person_from_reference(0)))
+    
+    def test_find_path(self):
+        # Test Ethan Eyre to Lee Elderson-Copper, his father's half brother
+        ethan: Person = self.family_tree.get_person_from_reference(24)
+        lee: Person = self.family_tree.get_person_from_reference(21)
+        path: Optional[List[Tuple[str, Person]]] = self.family_tree.find_path(ethan, lee)
+        self.assertEqual([label for label, _ in path], ["father", "mother", "child"])
+        self.assertIs(path[-1][1], lee)
+        
+        # Test Adam Elderson-Copper to Lester Elderson-Copper
+        path = self.family_tree.find_path(self.family_tree.get_person_from_reference(0), self.family_tree.get_person_from_reference(1))
+        self.assertEqual([label for label, _ in path], ["spouse"])
+        
+        # Test the hop limit
+        self.assertIsNone(self.family_tree.find_path(ethan, lee, 2))
+    
+    def test_alive_on(self):
+        # Test only the first generation was alive in 1936
+        self.assertEqual(len(self.family_tree.alive_on(datetime.date(1936, 1, 1))), 7)
+        
+        # Test Ginny Emmersohn is not alive after she died
+        alive: List[Person] = self.family_tree.alive_on(datetime.date(2000, 3, 23))
+        self.assertNotIn(self.family_tree.get_person_from_reference(4), alive)
+        self.assertIn(self.family_tree.get_person_from_reference(23), alive)
+        self.assertEqual(len(alive), 20)
+    
+    def test_population_by_year(self):
+        population = self.family_tree.population_by_year(1959, 1961)
+        self.assertEqual(population, {1959: 16, 1960: 16, 1961: 15})
+        
+        # Test alive_on and population_by_year both see someone marked deceased
+        person: Person = self.family_tree.alive_on(datetime.date(1961, 1, 1))[0]
+        self.family_tree.set_deceased(person, datetime.date(1960, 6, 1))
+        self.assertEqual(self.family_tree.population_by_year(1959, 1961), {1959: 16, 1960: 16, 1961: 14})
+        self.assertNotIn(person, self.family_tree.alive_on(datetime.date(1961, 1, 1)))
+    
+    def test_born_between(self):
+        # Test people born from 1950 to 1960
+        born: List[Person] = self.family_tree.born_between(datetime.date(1950, 1, 1), datetime.date(1960, 12, 31))
+        self.assertEqual(len(born), 9)
+        self.assertEqual(born[0].first_name, "David")
+        
+        # Test no one was born in the 1990s
+        self.assertEqual(self.family_tree.born_between(datetime.date(1990, 1, 1), datetime.date(1999, 12, 31)), [])
+    
+    def test_get_age_distribution(self):
+        # Test ages on the 1st of January 2000
+        self.assertEqual(self.family_tree.get_age_distribution(datetime.date(2000, 1, 1)), {10: 6, 40: 9, 60: 4})
+        
+        # Test ages at death
+        self.assertEqual(self.family_tree.get_age_at_death_distribution(), {20: 1, 60: 2})
+    
+    def test_get_age_distribution_by_generation(self):
+        # Test ages on the 1st of January 2000 by generation, Otto Emmersohn was not born yet
+        distribution: Dict[int, Dict[int, int]] = self.family_tree.get_age_distribution_by_generation(datetime.date(2000, 1, 1))
+        self.assertEqual(distribution, {0: {40: 6, 60: 4}, 1: {10: 4, 40: 3}, 2: {10: 2}})
+        
+        # Test everyone who died is a founder
+        self.assertEqual(self.family_tree.get_age_at_death_distribution_by_generation(), {0: {20: 1, 60: 2}})
+    
+    def test_query(self):
+        # Test Dylan Boulder's siblings match get_siblings
+        dylan: Person = self.family_tree.get_person_from_reference(20)
+        full_siblings, half_siblings = self.family_tree.get_siblings(dylan, True)
+        self.assertEqual(self.family_tree.query(dylan, "siblings"), full_siblings + half_siblings)
+        
+        # Test Ethan Eyre's uncles through his father
+        ethan: Person = self.family_tree.get_person_from_reference(24)
+        self.assertEqual([str(person) for person in self.family_tree.query(ethan, "father.siblings")], ["Angie Eyre", "Lee Elderson-Copper"])
+        
+        # Test Lee Elderson-Copper's parents' spouses which are not his parents
+        lee: Person = self.family_tree.get_person_from_reference(21)
+        self.assertEqual([str(person) for person in self.family_tree.query(lee, "parents.spouse - parents")], ["Greg Boulder"])
+        
+        # Test invalid queries
+        with self.assertRaises(ValueError):
+            self.family_tree.query(lee, "parents.cousins")
+        with self.assertRaises(ValueError):
+            self.family_tree.query(lee, "parents.")
+    
+    def test_get_couples(self):
+        # Test Carol Boulder had children with Greg Boulder and Bexton Elderson-Copper
+        carol: Person = self.family_tree.get_person_from_reference(8)
+        couples = self.family_tree.get_couples(carol)
+        self.assertEqual([len(couple.children) for couple in couples], [2, 1])
+        self.assertEqual([str(partner) for partner in self.family_tree.get_partners(carol)], ["Greg Boulder"])
+        
+        # Test a previous partner is recorded without changing the spouse
+        bexton: Person = self.family_tree.get_person_from_reference(9)
+        self.family_tree.add_partners(carol, bexton)
+        self.assertEqual(len(self.family_tree.get_couples(carol)), 2)
+        self.assertEqual([str(partner) for partner in self.family_tree.get_partners(carol)], ["Greg Boulder", "Bexton Elderson-Copper"])
+        self.assertEqual(str(carol.spouse), "Greg Boulder")
+        
+        # Test a couple with no children is removed unless they are partners
+        lee: Person = self.family_tree.get_person_from_reference(21)
+        self.family_tree.set_parents(lee, carol, None)
+        self.assertEqual(len(self.family_tree.get_couples(carol)), 3)
+        self.family_tree.set_parents(lee, None, None)
+        self.assertEqual(len(self.family_tree.get_couples(carol)), 2)
+        self.assertEqual(len(self.family_tree.couples_of[bexton]), 1)
+    
+    def test_get_people_with_surname(self):
+        # Test everyone with the surname Emmersohn
+        emmersohns: List[Person] = self.family_tree.get_people_with_surname("Emmersohn")
+        self.assertEqual([person.first_name for person in emmersohns], ["Thomas", "Ginny", "Jamie", "Dorothy", "Clyde", "Cornelia", "Otto"])
+        self.assertEqual(self.family_tree.get_surnames()["Elderson-Copper"], 4)
+        self.assertEqual(self.family_tree.get_people_with_surname("Smith"), [])
+    
+    def test_get_direct_lines(self):
+        # Test Otto Emmersohn's lines
+        otto: Person = self.family_tree.get_person_from_reference(23)
+        self.assertEqual([person.first_name for person in self.family_tree.get_patrilineal_line(otto)], ["Clyde", "Jamie", "Thomas"])
+        self.assertEqual([person.first_name for person in self.family_tree.get_matrilineal_line(otto)], ["Bethany", "Jane"])
+        # Test a line is extended when an ancestor at the top of it is given a father
+        # Test the cached line changes when a parent is set
+        thomas: Person = self.family_tree.get_person_from_reference(3)
+        adam: Person = self.family_tree.get_person_from_reference(0)
+        self.family_tree.set_parents(thomas, None, adam)
+        self.assertEqual([person.first_name for person in self.family_tree.get_patrilineal_line(otto)], ["Clyde", "Jamie", "Thomas", "Adam"])
+    
+    def test_get_generation(self):
+        # Test Adam Elderson-Copper is a founder
+        self.assertEqual(self.family_tree.get_generation(self.family_tree.get_person_from_reference(0)), (0, 0))
+        
+        # Test Otto Emmersohn, his father's line is a generation longer than his mother's
+        otto: Person = self.family_tree.get_person_from_reference(23)
+        self.assertEqual(self.family_tree.get_generation(otto), (2, 3))
+        self.assertEqual([person.first_name for person in self.family_tree.people_in_generation(3)], ["Otto"])
+        
+        # Test descendants move down when a founder's parents are set
+        adam: Person = self.family_tree.get_person_from_reference(0)
+        thomas: Person = self.family_tree.get_person_from_reference(3)
+        self.family_tree.set_parents(thomas, None, adam)
+        self.assertEqual(self.family_tree.get_generation(otto), (2, 4))
+        self.assertEqual([person.first_name for person in self.family_tree.people_in_generation(4)], ["Otto"])
+        
+        # Test someone can not be made their own ancestor
+        with self.assertRaises(ValueError):
+            self.family_tree.set_parents(adam, None, otto)
+        with self.assertRaises(ValueError):
+            self.family_tree.set_parents(adam, adam, None)
+    
+    def test_set_parents_of_many(self):
+        # Test founders given parents together move their descendants down in one pass
+        otto: Person = self.family_tree.get_person_from_reference(23)
+        adam: Person = self.family_tree.get_person_from_reference(0)
+        thomas: Person = self.family_tree.get_person_from_reference(3)
+        ginny: Person = self.family_tree.get_person_from_reference(4)
+        self.family_tree.set_parents_of_many([(thomas, None, adam), (ginny, None, adam)])
+        self.assertEqual(self.family_tree.get_generation(otto), (2, 4))
+        self.assertEqual([str(child) for child in self.family_tree.get_children(adam)][-2:], ["Thomas Emmersohn", "Ginny Emmersohn"])
+        
+        # Test nothing is changed if someone would become their own ancestor
+        amber: Person = self.family_tree.get_person_from_reference(2)
+        with self.assertRaises(ValueError):
+            self.family_tree.set_parents_of_many([(amber, None, None), (adam, amber, otto)])
+        self.assertIsNone(adam.father)
+        self.assertEqual(self.family_tree.get_generation(adam), (0, 0))
+    
+    def test_get_descendant_counts(self):
+        # Test Carol Boulder's children and grandchildren
+        carol: Person = self.family_tree.get_person_from_reference(8)
+        self.assertEqual(self.family_tree.get_descendant_counts(carol), (5, 5, 0))
+        
+        # Test Jeanette Colder has no deceased descendants until one dies
+        jeanette: Person = self.family_tree.get_person_from_reference(6)
+        self.assertEqual(self.family_tree.get_descendant_counts(jeanette), (3, 3, 0))
+        self.family_tree.set_deceased(self.family_tree.get_person_from_reference(16), datetime.date(2020, 1, 1))
+        self.assertEqual(self.family_tree.get_descendant_counts(jeanette), (3, 2, 1))
+        self.assertTrue(self.family_tree.descendants.up_to_date)
+        
+        # Test a child of two of Carol's descendants is only counted once (pedigree collapse)
+        dylan: Person = self.family_tree.get_person_from_reference(20)
+        angie: Person = self.family_tree.get_person_from_reference(19)
+        self.family_tree.add_person(Person("Pat", "Boulder", SimplifiedSex.FEMALE, datetime.date(2010, 1, 1), angie, dylan))
+        self.assertTrue(self.family_tree.descendants.up_to_date)
+        self.assertEqual(self.family_tree.get_descendant_counts(carol), (6, 6, 0))
+        
+        # Test adding a founder gives them no descendants
+        sam: Person = self.family_tree.add_person(Person("Sam", "Stranger", SimplifiedSex.MALE, datetime.date(1990, 1, 1)))
+        self.assertTrue(self.family_tree.descendants.up_to_date)
+        self.assertEqual(self.family_tree.get_descendant_counts(sam), (0, 0, 0))
+        
+        # Test the counts are rebuilt the same after parents change
+        ethan: Person = self.family_tree.get_person_from_reference(24)
+        self.family_tree.set_parents(ethan, angie, dylan)
+        self.assertFalse(self.family_tree.descendants.up_to_date)
+        self.assertEqual(self.family_tree.get_descendant_counts(carol), (6, 6, 0))
+        self.assertEqual(self.family_tree.get_descendant_counts(jeanette), (3, 2, 1))
+        self.assertTrue(self.family_tree.descendants.up_to_date)
+    
+    def test_top_lineages(self):
+        # Test the founders with the most living descendants
+        top: List[Tuple[Person, int]] = self.family_tree.top_lineages(2)
+        self.assertEqual([(str(person), living) for person, living in top], [("Carol Boulder", 5), ("Greg Boulder", 4)])
+        self.assertEqual(len(self.family_tree.top_lineages(100)), len(self.family_tree.people_in_generation(0)))
\ No newline at end of file
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+
+# This class contains tests for loading and saving the family tree as CSV
+# Using the the unittest library in Python
+# Saves the default family tree scenario defined in CreateTree.py and loads it back
+
+if __name__ == "__main__":
+    print("Please run me via \"unittest\". See readme for details.")
+
+
+import os
+import tempfile
+from typing import List
+import unittest
+
+from CreateTree import create_populated_family_tree
+from FamilyTree import FamilyTree
+from FamilyTreeCSV import COLUMNS, load_family_tree_from_csv, save_family_tree_to_csv
+from Person import Person
+
+class FamilyTreeCSVTesting(unittest.TestCase):
+    # Unit test setup
+    def setUp(self):
+        self.family_tree: FamilyTree = create_populated_family_tree()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, "family_tree.csv")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_round_trip(self):
+        # Save and load in chunks smaller than the tree
+        save_family_tree_to_csv(self.family_tree, self.path, 4)
+        loaded: FamilyTree = load_family_tree_from_csv(self.path, 4)
+        self.assertEqual(len(loaded.people), len(self.family_tree.people))
+        
+        # Test everyone's details and links are the same
+        for original, person in zip(self.family_tree.people, loaded.people):
+            self.assertEqual(str(person), str(original))
+            self.assertEqual(person.sex, original.sex)
+            self.assertEqual(person.date_of_birth, original.date_of_birth)
+            self.assertEqual(person.date_of_death, original.date_of_death)
+            self.assertEqual(str(person.mother), str(original.mother))
+            self.assertEqual(str(person.father), str(original.father))
+            self.assertEqual(str(person.spouse), str(original.spouse))
+        
+        # Test lookups work on the loaded tree
+        self.assertEqual(len(loaded.get_children(loaded.get_person_from_reference(9))), 1)
+        self.assertEqual(len(loaded.get_deceased()), 3)
+    
+    def test_remarriage(self):
+        # Test a remarriage is saved with only the current couple as spouses
+        adam: Person = self.family_tree.get_person_from_reference(0)
+        lester: Person = self.family_tree.get_person_from_reference(1)
+        amber: Person = self.family_tree.get_person_from_reference(2)
+        self.family_tree.set_partner(adam, lester)
+        self.family_tree.set_partner(adam, amber)
+        self.assertIsNone(lester.spouse)
+        self.assertEqual(len(self.family_tree.get_partners(adam)), 2)
+        
+        save_family_tree_to_csv(self.family_tree, self.path)
+        loaded: FamilyTree = load_family_tree_from_csv(self.path)
+        self.assertIs(loaded.get_person_from_reference(0).spouse, loaded.get_person_from_reference(2))
+        self.assertIs(loaded.get_person_from_reference(2).spouse, loaded.get_person_from_reference(0))
+        self.assertIsNone(loaded.get_person_from_reference(1).spouse)
+    
+    def test_children_before_parents(self):
+        # Test a child can be listed before their parents
+        with open(self.path, "w", encoding="utf-8") as csv_file:
+            csv_file.write(",".join(COLUMNS) + "\n")
+            csv_file.write("c,Chris,Smith,male,2000-01-01,,m,f,\n")
+            csv_file.write("m,Mary,Smith,female,1970-01-01,,,,f\n")
+            csv_file.write("f,Fred,Smith,male,1970-01-01,2020-01-01,,,m\n")
+        loaded: FamilyTree = load_family_tree_from_csv(self.path)
+        children: List[Person] = loaded.get_children(loaded.get_person_from_reference(1))
+        self.assertEqual([str(child) for child in children], ["Chris Smith"])
+        self.assertIs(loaded.get_person_from_reference(1).spouse, loaded.get_person_from_reference(2))
+    
+    def test_unknown_id(self):
+        # Test linking to someone who is not in the file
+        with open(self.path, "w", encoding="utf-8") as csv_file:
+            csv_file.write(",".join(COLUMNS) + "\n")
+            csv_file.write("c,Chris,Smith,male,2000-01-01,,m,,\n")
+        with self.assertRaises(ValueError):
+            load_family_tree_from_csv(self.path)
+    
+    def test_unknown_sex(self):
+        # Test a row with a sex which is not in SimplifiedSex
+        with open(self.path, "w", encoding="utf-8") as csv_file:
+            csv_file.write(",".join(COLUMNS) + "\n")
+            csv_file.write("c,Chris,Smith,unknown,2000-01-01,,,,\n")
+        with self.assertRaisesRegex(ValueError, "Person c"):
+            load_family_tree_from_csv(self.path)
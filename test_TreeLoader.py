@@ -0,0 +1,53 @@
+#!/usr/bin/python
+
+# This class contains tests for loading the family tree in the background
+# Using the the unittest library in Python
+# Loads the default family tree scenario defined in CreateTree.py on the background thread
+
+if __name__ == "__main__":
+    print("Please run me via \"unittest\". See readme for details.")
+
+
+import threading
+import unittest
+
+from CreateTree import create_populated_family_tree
+from FamilyTree import FamilyTree
+from TreeLoader import TreeLoader
+
+class TreeLoaderTesting(unittest.TestCase):
+    def test_wait_for(self):
+        # Test a loader which doesn't report stages reaches them all when it finishes
+        tree_loader: TreeLoader = TreeLoader(lambda report_stage: create_populated_family_tree())
+        tree_loader.start()
+        family_tree: FamilyTree = tree_loader.wait_for("relationships")
+        self.assertEqual(len(family_tree.people), 25)
+        self.assertTrue(tree_loader.is_ready("people"))
+        self.assertEqual(list(tree_loader.timings.keys()), ["people", "relationships"])
+    
+    def test_people_stage(self):
+        # Test the people stage can be waited for while relationships are still loading
+        relationships_allowed: threading.Event = threading.Event()
+        
+        def load(report_stage):
+            family_tree: FamilyTree = create_populated_family_tree()
+            report_stage("people", family_tree)
+            relationships_allowed.wait()
+            return family_tree
+        
+        tree_loader: TreeLoader = TreeLoader(load)
+        tree_loader.start()
+        self.assertEqual(len(tree_loader.wait_for("people").people), 25)
+        self.assertFalse(tree_loader.is_ready("relationships"))
+        relationships_allowed.set()
+        tree_loader.wait_for("relationships")
+    
+    def test_error(self):
+        # Test an error in the loader is raised when waiting
+        def load(report_stage):
+            raise ValueError("invalid family tree")
+        
+        tree_loader: TreeLoader = TreeLoader(load)
+        tree_loader.start()
+        with self.assertRaises(ValueError):
+            tree_loader.wait_for("people")